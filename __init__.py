@@ -15,7 +15,7 @@ bl_info = {
 
 import bpy
 from bpy.types import AddonPreferences
-from . import operators
+from . import operators, graph, usage, search, colors, profiling, sockets
 from .lang_dict import LANG_DICT
 
 addon_keymaps = {}
@@ -53,6 +53,13 @@ class CCC_AddonPreferences(AddonPreferences):
         default=get_system_language()
     )
 
+    profiling: bpy.props.BoolProperty(
+        name="Profiling HUD",
+        description="Time each highlighter stage and show p50/p95/max in the node editor",
+        default=False,
+        update=lambda self, context: profiling.set_enabled(self.profiling)
+    )
+
     def draw(self, context):
         layout = self.layout
         from .lang_dict import LANG_DICT
@@ -68,25 +75,50 @@ class CCC_AddonPreferences(AddonPreferences):
             layout.prop(kmi, 'type', text=t["highlighter_hotkey"], full_event=True)
         else:
             layout.label(text=t["hotkey_not_initialized"])
+        kmi = find_user_keyconfig('CCC_OVERVIEW_KEYMAP')
+        if kmi:
+            layout.prop(kmi, 'type', text=t["overview_hotkey"], full_event=True)
+        kmi = find_user_keyconfig('CCC_SEARCH_KEYMAP')
+        if kmi:
+            layout.prop(kmi, 'type', text=t["search_hotkey"], full_event=True)
+        row = layout.row()
+        row.prop(self, "profiling", text=t["profiling"])
+        if self.profiling:
+            row.operator(profiling.CCC_OT_profile_export.bl_idname, text=t["profile_export"])
 
 
 classes = (
     operators.CCC_OT_jump_to_node,
+    operators.CCC_OT_jump_to_tree,
+    operators.CCC_OT_pie_page,
     operators.CCC_MT_pie_menu,
     operators.CCC_OT_modal_link_highlighter,
+    operators.CCC_OT_find_dead_nodes,
+    operators.CCC_OT_clear_pins,
+    operators.CCC_OT_search_nodes,
+    profiling.CCC_OT_profile_export,
     CCC_AddonPreferences
 )
 
 def register():
     for c in classes:
         bpy.utils.register_class(c)
-    bpy.types.WindowManager.ccc_upstreams = bpy.props.StringProperty()
-    bpy.types.WindowManager.ccc_downstreams = bpy.props.StringProperty()
+    colors.register()
+    graph.register()
+    operators.register()
+    usage.register()
+    if bpy.context.preferences.addons[__name__].preferences.profiling:
+        profiling.set_enabled(True)
     kc = bpy.context.window_manager.keyconfigs.addon
     if kc:
         km = kc.keymaps.new(name='Node Editor', space_type='NODE_EDITOR')
         kmi = km.keymap_items.new("node.ccc_modal_link_highlighter", type='C', value='PRESS', alt=True)
         addon_keymaps['CCC_MODAL_KEYMAP'] = (km, kmi)
+        kmi = km.keymap_items.new("node.ccc_modal_link_highlighter", type='C', value='PRESS', alt=True, shift=True)
+        kmi.properties.mode = 'OVERVIEW'
+        addon_keymaps['CCC_OVERVIEW_KEYMAP'] = (km, kmi)
+        kmi = km.keymap_items.new("node.ccc_search_nodes", type='F', value='PRESS', alt=True, shift=True)
+        addon_keymaps['CCC_SEARCH_KEYMAP'] = (km, kmi)
 
 def unregister():
     if addon_keymaps:
@@ -96,9 +128,17 @@ def unregister():
             except:
                 pass
         addon_keymaps.clear()
-    for n in ["ccc_upstreams", "ccc_downstreams"]:
-        if hasattr(bpy.types.WindowManager, n):
-            delattr(bpy.types.WindowManager, n)
+    profiling.set_enabled(False)
+    operators.clear_jump_flash()
+    operators.clear_pie_entries()
+    operators.unregister()
+    operators.clear_graph_jobs()
+    operators.clear_jump_pins()
+    usage.unregister()
+    colors.unregister()
+    search.clear()
+    sockets.reset()
+    graph.unregister()
     for c in reversed(classes):
         try:
             bpy.utils.unregister_class(c)
@@ -0,0 +1,100 @@
+"""Lightweight stand-in for the parts of ``bpy`` the pure-Python modules touch.
+
+Good enough to import graph, colors, search, spatial and usage in plain CPython
+and to build synthetic trees for them; nothing here draws or registers.
+"""
+import sys, types, itertools
+
+_ptr = itertools.count(0x10000, 0x40)
+
+class _Struct:
+    def as_pointer(self): return self._ptr
+
+class _RNA:
+    def __init__(self, identifier, name): self.identifier, self.name = identifier, name
+
+class Vec(tuple):
+    @property
+    def x(self): return self[0]
+    @property
+    def y(self): return self[1]
+
+class NodeSocket(_Struct):
+    def __init__(self, node, is_output, identifier, name="Value"):
+        self._ptr = next(_ptr); self.node, self.is_output, self.identifier, self.name = node, is_output, identifier, name
+        self.links, self.enabled, self.id_data = [], True, node.id_data
+    @property
+    def is_linked(self): return bool(self.links)
+
+class NodeLink(_Struct):
+    def __init__(self, a, b):
+        self._ptr = next(_ptr); self.from_socket, self.to_socket, self.from_node, self.to_node = a, b, a.node, b.node
+        self.is_hidden = self.is_muted = False; self.is_valid = True
+
+class Node(_Struct):
+    bl_idname = "Node"
+    def __init__(self, tree, bl_idname, n_in=1, n_out=1):
+        self._ptr = next(_ptr); self.id_data, self.bl_idname = tree, bl_idname
+        self.bl_rna = _RNA(bl_idname, bl_idname); self.name = self.label = ""
+        self.inputs = [NodeSocket(self, False, f"Input_{i}") for i in range(n_in)]
+        self.outputs = [NodeSocket(self, True, f"Output_{i}") for i in range(n_out)]
+        self.location, self.dimensions, self.parent, self.hide = Vec((0.0, 0.0)), Vec((140.0, 100.0)), None, False
+        self.use_custom_color, self.color, self.node_tree, self.select = False, (0.5, 0.5, 0.5), None, False
+        self.is_active_output = True
+
+class _Nodes(list):
+    active = None
+    def get(self, name, default=None): return next((n for n in self if n.name == name), default)
+
+class NodeTree(_Struct):
+    is_embedded_data = False
+    def __init__(self, name, bl_idname="ShaderNodeTree"):
+        self._ptr = next(_ptr); self.name, self.bl_idname = name, bl_idname
+        self.nodes, self.links = _Nodes(), []
+    def new_node(self, bl_idname, n_in=1, n_out=1, name=None):
+        nd = Node(self, bl_idname, n_in, n_out); nd.name = name or f"{bl_idname}.{len(self.nodes):05d}"
+        self.nodes.append(nd); return nd
+    def new_link(self, a, b):
+        lk = NodeLink(a, b); self.links.append(lk); a.links.append(lk); b.links.append(lk); return lk
+
+class ID(_Struct): is_embedded_data = False
+class Material(ID): pass
+class World(ID): pass
+class Light(ID): pass
+class Scene(ID): pass
+class FreestyleLineStyle(ID): pass
+
+class _Handlers:
+    def __init__(self):
+        for n in ("depsgraph_update_post", "undo_post", "redo_post", "load_post"): setattr(self, n, [])
+    @staticmethod
+    def persistent(f): return f
+
+class _Timers:
+    def __init__(self): self._fns = set()
+    def register(self, fn, first_interval=0.0): self._fns.add(fn)
+    def unregister(self, fn): self._fns.discard(fn)
+    def is_registered(self, fn): return fn in self._fns
+
+_theme_colors = {k: (0.4, 0.4, 0.4) for k in ("group_node", "frame_node", "layout_node", "input_node", "output_node",
+                                              "shader_node", "geometry_node", "texture_node", "color_node", "vector_node",
+                                              "converter_node", "filter_node")}
+
+def install():
+    """Put the stand-in into ``sys.modules`` as ``bpy`` (only when the real one is missing)."""
+    if "bpy" in sys.modules: return sys.modules["bpy"]
+    bpy = types.ModuleType("bpy")
+    bpy.app = types.SimpleNamespace(handlers=_Handlers(), timers=_Timers(), version=(4, 5, 0), background=True)
+    bpy.types = types.SimpleNamespace(Node=Node, NodeTree=NodeTree, NodeSocket=NodeSocket, NodeLink=NodeLink, ID=ID,
+                                      Material=Material, World=World, Light=Light, Scene=Scene,
+                                      FreestyleLineStyle=FreestyleLineStyle)
+    # A few registered node types so colors.build_class_table has something to classify.
+    for idname in ("ShaderNodeMath", "ShaderNodeMix", "ShaderNodeTexImage", "ShaderNodeBsdfPrincipled", "GeometryNodeSetPosition",
+                   "CompositorNodeBlur", "CompositorNodeViewer", "CompositorNodeMath", "NodeReroute", "NodeFrame"):
+        cls = type(idname, (Node,), {"bl_idname": idname}); cls.bl_rna = _RNA(idname, idname); setattr(bpy.types, idname, cls)
+    theme = types.SimpleNamespace(node_editor=types.SimpleNamespace(**_theme_colors, noodle_curving=5))
+    bpy.context = types.SimpleNamespace(preferences=types.SimpleNamespace(themes=[theme], system=types.SimpleNamespace(ui_scale=1.0)))
+    bpy.msgbus = types.SimpleNamespace(subscribe_rna=lambda **kw: None, clear_by_owner=lambda owner: None)
+    bpy.data = types.SimpleNamespace(node_groups=[], materials=[], worlds=[], lights=[], scenes=[], linestyles=[])
+    sys.modules["bpy"] = bpy
+    return bpy
@@ -0,0 +1,145 @@
+"""Benchmark the add-on's hot paths on synthetic trees.
+
+Plain CPython (uses the bpy stand-in)::
+
+    python benchmarks/run.py --sizes 100,1000,10000 --save benchmarks/baselines/main.json
+    python benchmarks/run.py --sizes 100,1000,10000 --compare benchmarks/baselines/main.json
+
+Inside Blender (real trees)::
+
+    blender --background --factory-startup --python benchmarks/run.py -- --sizes 1000,50000
+
+``--compare`` exits non-zero when a result's check value differs from the baseline
+(a behavior regression) or a median is slower than ``--tolerance`` times the baseline.
+"""
+import argparse, importlib, json, os, platform, random, statistics, sys, time, types
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+PACKAGE = "nodelink_bench"
+sys.path.insert(0, HERE)
+
+try:
+    import bpy
+    IN_BLENDER = hasattr(bpy, "data") and hasattr(bpy.data, "node_groups") and not isinstance(bpy.data, types.SimpleNamespace)
+except ImportError:
+    import fakebpy
+    bpy = fakebpy.install(); IN_BLENDER = False
+
+import numpy as np
+import synth
+
+def load(name):
+    """Import one add-on module without running the add-on's ``__init__`` (no registration, no GPU)."""
+    if PACKAGE not in sys.modules:
+        pkg = types.ModuleType(PACKAGE); pkg.__path__ = [os.path.dirname(HERE)]; sys.modules[PACKAGE] = pkg
+    return importlib.import_module(f"{PACKAGE}.{name}")
+
+graph, colors, geometry, search, spatial = (load(m) for m in ("graph", "colors", "geometry", "search", "spatial"))
+
+def timed(setup, fn, repeat):
+    """(samples in ms, result of the last run); ``setup`` runs untimed before every sample."""
+    samples, res = [], None
+    for _ in range(repeat):
+        st = setup(); t = time.perf_counter(); res = fn(st); samples.append((time.perf_counter() - t) * 1e3)
+    return samples, res
+
+def fresh_graph(tree):
+    graph._graphs.clear(); graph._interfaces.clear()
+    return graph.TreeGraph(tree)
+
+def tree_benches(tree):
+    """name -> (setup, fn returning a check value) for one tree."""
+    def chains(g):
+        return sum(len(g.chain(s, through_groups=True)[1]) for s in range(len(g.sockets)) if g.is_out[s])
+    def cone(g):
+        s = next((s for s in range(len(g.sockets) // 2, len(g.sockets)) if g.is_out[s]), 0)
+        return len(g.dependency_cone(s)[0]) if g.sockets else 0
+    def classify(nodes):
+        colors._theme_colors.clear(); colors.build_class_table()
+        return len({colors.get_node_border_color(nd) for nd in nodes})
+    def index(_):
+        idx = search.NodeIndex(); idx.sync(tree)
+        return sum(len(idx.query(q)) for q in ("math", "mat 1", "reroute", "grp", "0042", "m"))
+    def grid(_):
+        g = spatial.NodeGrid(tree, 1.0); rng = random.Random(3)
+        return sum(len(g.query(rng.uniform(0, 8000), rng.uniform(-6000, 0), 30.0)) for _ in range(1000))
+    nodes = list(tree.nodes)
+    return {"graph_build": (lambda: None, lambda _: len(fresh_graph(tree).links)),
+            "chains": (lambda: fresh_graph(tree), chains),
+            "cone": (lambda: fresh_graph(tree), cone),
+            "dead": (lambda: fresh_graph(tree), lambda g: tuple(map(len, g.dead_analysis()))),
+            "depths": (lambda: fresh_graph(tree), lambda g: max(g.node_depths(), default=0)),
+            "colors": (lambda: nodes, classify),
+            "search_index": (lambda: None, index),
+            "node_grid": (lambda: None, grid)}
+
+def geometry_benches(n):
+    rng = np.random.default_rng(0)
+    ends = rng.uniform(-4000, 4000, (n, 4)); rects = np.sort(rng.uniform(0, 2000, (n, 2, 2)), axis=1).transpose(0, 2, 1).reshape(n, 4)
+    affine = (0.5, 0.5, 100.0, 100.0)
+    def curves(_):
+        ctrl = geometry.link_control_points(ends, 0.5)
+        return geometry.tessellate_links(ctrl, geometry.lod_segments(ctrl, affine[0]), affine)
+    polys = curves(None); outlines = geometry.rounded_rects_lod(rects, 10)[0]
+    return {"tessellate": (lambda: None, lambda _: sum(len(p) for p in curves(None))),
+            "stroke_links": (lambda: None, lambda _: len(geometry.stroke_polylines(polys, 3.0)[0])),
+            "line_segments": (lambda: None, lambda _: len(geometry.line_segments(polys)[0])),
+            "rounded_rects": (lambda: None, lambda _: sum(len(o) for o in geometry.rounded_rects_lod(rects, 10)[0])),
+            "stroke_borders": (lambda: None, lambda _: len(geometry.stroke_polylines(outlines, 5.0, closed=True)[0]))}
+
+def run(args):
+    builder = synth.BpyBuilder() if IN_BLENDER else synth.FakeBuilder()
+    results = {}
+    def record(key, samples, check):
+        check = json.loads(json.dumps(check))  # compare like a reloaded baseline (tuples become lists)
+        results[key] = {"median_ms": statistics.median(samples), "min_ms": min(samples), "check": check}
+        print(f"{key:<48}{results[key]['median_ms']:>10.2f}{results[key]['min_ms']:>10.2f}  {check}")
+    print(f"{'benchmark':<48}{'median':>10}{'min':>10}  check")
+    for n in args.sizes:
+        for name, (setup, fn) in geometry_benches(n).items(): record(f"geometry/{n}/{name}", *timed(setup, fn, args.repeat))
+        for shape in args.shapes:
+            for kind in args.kinds:
+                before = set(bpy.data.node_groups.keys()) if IN_BLENDER else None
+                tree = synth.SHAPES[shape](builder, kind, n)
+                for name, (setup, fn) in tree_benches(tree).items():
+                    record(f"{shape}/{kind}/{n}/{name}", *timed(setup, fn, args.repeat))
+                if IN_BLENDER:
+                    for key in set(bpy.data.node_groups.keys()) - before: bpy.data.node_groups.remove(bpy.data.node_groups[key])
+    return results
+
+def compare(results, baseline, tolerance):
+    failed = 0
+    for key, old in baseline["results"].items():
+        if (new := results.get(key)) is None: continue
+        ratio = new["median_ms"] / old["median_ms"] if old["median_ms"] else 1.0
+        bad = "" if new["check"] == old["check"] else "CHECK MISMATCH"
+        bad = bad or ("SLOWER" if ratio > tolerance else "")
+        failed += bool(bad)
+        print(f"{key:<48}{old['median_ms']:>10.2f}{new['median_ms']:>10.2f}{ratio:>8.2f}x  {bad}")
+    return failed
+
+def main(argv):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--sizes", default="100,1000,10000", type=lambda s: [int(x) for x in s.split(",")])
+    p.add_argument("--shapes", default=",".join(synth.SHAPES), type=lambda s: s.split(","))
+    p.add_argument("--kinds", default="ShaderNodeTree", type=lambda s: s.split(","), help="comma-separated tree types: " + ", ".join(synth.KINDS))
+    p.add_argument("--repeat", default=5, type=int)
+    p.add_argument("--save", help="write results to this JSON baseline")
+    p.add_argument("--compare", help="compare against this JSON baseline")
+    p.add_argument("--tolerance", default=1.25, type=float, help="allowed median slowdown ratio")
+    args = p.parse_args(argv)
+    results = run(args)
+    meta = {"python": platform.python_version(), "numpy": np.__version__, "blender": list(bpy.app.version) if IN_BLENDER else None,
+            "backend": "blender" if IN_BLENDER else "stand-in", "repeat": args.repeat}
+    if args.save:
+        os.makedirs(os.path.dirname(os.path.abspath(args.save)), exist_ok=True)
+        with open(args.save, "w") as f: json.dump({"meta": meta, "results": results}, f, indent=1)
+    if args.compare:
+        with open(args.compare) as f: baseline = json.load(f)
+        print(f"\n{'benchmark':<48}{'base':>10}{'now':>10}{'ratio':>9}")
+        return 1 if compare(results, baseline, args.tolerance) else 0
+    return 0
+
+if __name__ == "__main__":
+    status = main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else sys.argv[1:])
+    if status: sys.exit(status)
@@ -0,0 +1,138 @@
+"""Synthetic node trees of configurable shape, built through real bpy or the stand-in."""
+import random
+
+MATH = {"ShaderNodeTree": "ShaderNodeMath", "GeometryNodeTree": "ShaderNodeMath", "CompositorNodeTree": "CompositorNodeMath"}
+GROUP = {"ShaderNodeTree": "ShaderNodeGroup", "GeometryNodeTree": "GeometryNodeGroup", "CompositorNodeTree": "CompositorNodeGroup"}
+KINDS = tuple(MATH)
+COLUMN = 40
+SPACING = (200.0, 150.0)
+
+class FakeBuilder:
+    def __init__(self):
+        import fakebpy
+        self.fake = fakebpy
+
+    def tree(self, name, kind):
+        return self.fake.NodeTree(name, kind)
+
+    def node(self, tree, idname, n_in=1, n_out=1):
+        return tree.new_node(idname, n_in, n_out)
+
+    def link(self, tree, a, b):
+        tree.new_link(a, b)
+
+    def group_io(self, tree, n):
+        gi = tree.new_node("NodeGroupInput", 0, n); go = tree.new_node("NodeGroupOutput", n, 0)
+        for i in range(n): gi.outputs[i].identifier = go.inputs[i].identifier = f"Socket_{i}"
+        return gi, go
+
+    def group_node(self, tree, inner, n):
+        nd = tree.new_node(GROUP[tree.bl_idname], n, n); nd.node_tree = inner
+        for i in range(n): nd.inputs[i].identifier = nd.outputs[i].identifier = f"Socket_{i}"
+        return nd
+
+    def place(self, node, i):
+        node.location = self.fake.Vec(((i // COLUMN) * SPACING[0], -(i % COLUMN) * SPACING[1]))
+
+class BpyBuilder:
+    def __init__(self):
+        import bpy
+        self.bpy = bpy
+
+    def tree(self, name, kind):
+        return self.bpy.data.node_groups.new(name, kind)
+
+    def node(self, tree, idname, n_in=1, n_out=1):
+        return tree.nodes.new(idname)
+
+    def link(self, tree, a, b):
+        tree.links.new(a, b)
+
+    def group_io(self, tree, n):
+        for i in range(n):
+            tree.interface.new_socket(f"In {i}", in_out='INPUT', socket_type='NodeSocketFloat')
+            tree.interface.new_socket(f"Out {i}", in_out='OUTPUT', socket_type='NodeSocketFloat')
+        return tree.nodes.new("NodeGroupInput"), tree.nodes.new("NodeGroupOutput")
+
+    def group_node(self, tree, inner, n):
+        nd = tree.nodes.new(GROUP[tree.bl_idname]); nd.node_tree = inner
+        return nd
+
+    def place(self, node, i):
+        node.location = ((i // COLUMN) * SPACING[0], -(i % COLUMN) * SPACING[1])
+
+def _output(b, tree, src):
+    _, go = b.group_io(tree, 1); b.link(tree, src.outputs[0], go.inputs[0])
+    return go
+
+def random_dag(b, kind, n, seed=0, dangling=0.1, window=64):
+    """``n`` math nodes, each fed by a nearby earlier node; about ``dangling`` of them lead nowhere."""
+    rng = random.Random(seed); tree = b.tree(f"dag_{n}", kind); nodes = []
+    for i in range(n):
+        nd = b.node(tree, MATH[kind], 2, 1); b.place(nd, i)
+        if nodes and rng.random() > dangling: b.link(tree, nodes[rng.randrange(max(0, i - window), i)].outputs[0], nd.inputs[0])
+        nodes.append(nd)
+    _output(b, tree, nodes[-1])
+    return tree
+
+def reroute_chains(b, kind, n, length=32):
+    """Math nodes joined by chains of ``length`` reroutes; ``n`` counts every node."""
+    tree = b.tree(f"reroutes_{n}", kind); prev = b.node(tree, MATH[kind], 2, 1); b.place(prev, 0)
+    for i in range(1, n):
+        nd = b.node(tree, "NodeReroute" if i % (length + 1) else MATH[kind], 1 if i % (length + 1) else 2, 1)
+        b.place(nd, i); b.link(tree, prev.outputs[0], nd.inputs[0]); prev = nd
+    _output(b, tree, prev)
+    return tree
+
+def fanout(b, kind, n, branching=4):
+    """One source feeding about ``n`` targets through a tree of reroutes."""
+    tree = b.tree(f"fanout_{n}", kind); src = b.node(tree, MATH[kind], 2, 1); b.place(src, 0)
+    level, i = [src], 1
+    while i + len(level) * branching < n * 0.25:
+        nxt = []
+        for p in level:
+            for _ in range(branching):
+                r = b.node(tree, "NodeReroute", 1, 1); b.place(r, i); i += 1; b.link(tree, p.outputs[0], r.inputs[0]); nxt.append(r)
+        level = nxt
+    last = None
+    for k in range(i, n):
+        nd = b.node(tree, MATH[kind], 2, 1); b.place(nd, k); b.link(tree, level[k % len(level)].outputs[0], nd.inputs[0]); last = nd
+    _output(b, tree, last or src)
+    return tree
+
+def nested_groups(b, kind, n, depth=8, width=8, every=10):
+    """A random DAG where every ``every``-th node is a group nested ``depth`` levels deep.
+
+    Each level chains ``width`` math nodes on socket 0 and passes socket 1 straight through.
+    """
+    inner = None
+    for d in range(depth):
+        g = b.tree(f"group_{n}_{d}", kind); gi, go = b.group_io(g, 2); prev = gi
+        for i in range(width):
+            nd = b.node(g, MATH[kind], 2, 1); b.place(nd, i); b.link(g, prev.outputs[0], nd.inputs[0]); prev = nd
+        if inner is not None:
+            gn = b.group_node(g, inner, 2); b.link(g, prev.outputs[0], gn.inputs[0]); b.link(g, gi.outputs[1], gn.inputs[1])
+            b.link(g, gn.outputs[0], go.inputs[0]); b.link(g, gn.outputs[1], go.inputs[1])
+        else:
+            b.link(g, prev.outputs[0], go.inputs[0]); b.link(g, gi.outputs[1], go.inputs[1])
+        inner = g
+    rng = random.Random(1); tree = b.tree(f"nested_{n}", kind); nodes = []
+    for i in range(n):
+        nd = b.group_node(tree, inner, 2) if i % every == every - 1 else b.node(tree, MATH[kind], 2, 1); b.place(nd, i)
+        if nodes:
+            b.link(tree, nodes[rng.randrange(max(0, i - 64), i)].outputs[0], nd.inputs[0])
+            b.link(tree, nodes[rng.randrange(max(0, i - 64), i)].outputs[0], nd.inputs[1])
+        nodes.append(nd)
+    _output(b, tree, nodes[-1])
+    return tree
+
+def reroute_cycles(b, kind, n, ring=3):
+    """A random DAG in which every 20th node is fed from a loop of ``ring`` reroutes."""
+    tree = random_dag(b, kind, n, seed=2); nodes = [nd for nd in tree.nodes if nd.bl_idname == MATH[kind]]
+    for k in range(0, len(nodes), 20):
+        rr = [b.node(tree, "NodeReroute", 1, 1) for _ in range(ring)]
+        for i, r in enumerate(rr): b.place(r, n + k + i); b.link(tree, r.outputs[0], rr[(i + 1) % ring].inputs[0])
+        b.link(tree, rr[0].outputs[0], nodes[k].inputs[1])
+    return tree
+
+SHAPES = {"dag": random_dag, "reroutes": reroute_chains, "fanout": fanout, "nested": nested_groups, "cycles": reroute_cycles}
@@ -1,4 +1,5 @@
 import bpy, re, colorsys
+from functools import lru_cache
 
 SAT_BOOST = 0.6
 VAL_BOOST = 0.85
@@ -67,17 +68,20 @@ EXACT_KEY = {
     "CompositorNodeImage": "input_node",
 }
 
+# Compositor categories in priority order; the first category matching anywhere wins.
 _COMPO_PAT = {
-    "OUTPUT": re.compile(r"(Composite|Viewer|Output)", re.I),
-    "INPUT": re.compile(r"(Image|RLayers|Render|Mask|Movie|Input)", re.I),
-    "FILTER": re.compile(r"(Filter|Blur|Denoise|Glare|Defocus|Bilateral)", re.I),
-    "COLOR": re.compile(r"(Color|Hue|Saturation|Gamma|Exposure|Levels|Balance|Curves|MixRGB)", re.I),
-    "CONVERTER": re.compile(r"(Math|Convert|AlphaOver|ZCombine|SetAlpha|RGBToBW|Premul)", re.I),
-    "VECTOR": re.compile(r"(Vector|Translate|Rotate|Scale|Transform|Displace|Map)", re.I),
-    "GROUP": re.compile(r"(Group)", re.I),
-    "LAYOUT": re.compile(r"(Reroute)", re.I),
-    "FRAME": re.compile(r"(Frame)", re.I),
+    "OUTPUT": r"Composite|Viewer|Output",
+    "INPUT": r"Image|RLayers|Render|Mask|Movie|Input",
+    "FILTER": r"Filter|Blur|Denoise|Glare|Defocus|Bilateral",
+    "COLOR": r"Color|Hue|Saturation|Gamma|Exposure|Levels|Balance|Curves|MixRGB",
+    "CONVERTER": r"Math|Convert|AlphaOver|ZCombine|SetAlpha|RGBToBW|Premul",
+    "VECTOR": r"Vector|Translate|Rotate|Scale|Transform|Displace|Map",
+    "GROUP": r"Group",
+    "LAYOUT": r"Reroute",
+    "FRAME": r"Frame",
 }
+_COMPO_RE = re.compile("|".join(f"(?P<{k}>{p})" for k, p in _COMPO_PAT.items()), re.I)
+_COMPO_RANK = {k: i for i, k in enumerate(_COMPO_PAT)}
 
 def _key_shader(bid):
     if "Output" in bid: return "output_node"
@@ -97,26 +101,89 @@ def _key_geo(bid):
     return "geometry_node"
 
 def _key_comp(bid, name):
-    for k, pat in _COMPO_PAT.items():
-        if pat.search(bid) or pat.search(name or ""):
-            return THEME_KEYS[k]
-    return "converter_node"
+    groups = {m.lastgroup for m in _COMPO_RE.finditer(f"{bid} {name or ''}")}
+    return THEME_KEYS[min(groups, key=_COMPO_RANK.get)] if groups else "converter_node"
 
-def get_node_border_color(node, cache):
+def classify(bid, name=""):
+    """Theme color key for a node type."""
+    if bid in EXACT_KEY: return EXACT_KEY[bid]
+    if bid.startswith("ShaderNode"): return _key_shader(bid)
+    if bid.startswith("GeometryNode"): return _key_geo(bid)
+    if bid.startswith("CompositorNode"): return _key_comp(bid, name)
+    return "shader_node"
+
+# Blender's built-in socket colors by NodeSocket.type; the theme does not expose them to Python.
+SOCKET_COLORS = {
+    "FLOAT": (0.63, 0.63, 0.63, 1.0),
+    "INT": (0.35, 0.55, 0.36, 1.0),
+    "BOOLEAN": (0.80, 0.65, 0.84, 1.0),
+    "VECTOR": (0.39, 0.39, 0.78, 1.0),
+    "ROTATION": (0.65, 0.39, 0.78, 1.0),
+    "MATRIX": (0.72, 0.20, 0.52, 1.0),
+    "RGBA": (0.78, 0.78, 0.16, 1.0),
+    "STRING": (0.44, 0.70, 1.00, 1.0),
+    "MENU": (0.40, 0.40, 0.40, 1.0),
+    "SHADER": (0.39, 0.78, 0.39, 1.0),
+    "GEOMETRY": (0.00, 0.84, 0.64, 1.0),
+    "OBJECT": (0.93, 0.62, 0.36, 1.0),
+    "COLLECTION": (0.96, 0.96, 0.96, 1.0),
+    "IMAGE": (0.39, 0.22, 0.39, 1.0),
+    "TEXTURE": (0.62, 0.31, 0.64, 1.0),
+    "MATERIAL": (0.92, 0.46, 0.51, 1.0),
+}
+
+def socket_color(sock):
+    """Link color for data leaving ``sock``: its type's color, or a custom socket's own draw color."""
+    if (col := SOCKET_COLORS.get(sock.type)) is not None: return col
+    try: c = sock.draw_color(bpy.context, sock.node); return (c[0], c[1], c[2], 1.0)
+    except (AttributeError, TypeError, ReferenceError): return (1.0, 1.0, 1.0, 1.0)
+
+# bl_idname -> theme key for every registered node type, filled at register time.
+CLASS_TABLE = {}
+_theme_colors = {}
+
+def build_class_table():
+    CLASS_TABLE.clear()
+    for attr in dir(bpy.types):
+        cls = getattr(bpy.types, attr, None)
+        if isinstance(cls, type) and issubclass(cls, bpy.types.Node) and cls is not bpy.types.Node:
+            rna = cls.bl_rna; CLASS_TABLE[rna.identifier] = classify(rna.identifier, rna.name)
+
+def theme_color(key):
+    """Boosted theme color for ``key``, cached until the node editor theme changes."""
+    if (col := _theme_colors.get(key)) is None: col = _theme_colors[key] = _boost(_safe_get(key, (0.8,0.8,0.8,1.0)))
+    return col
+
+@lru_cache(maxsize=256)
+def _boost_custom(r, g, b):
+    return _boost((r, g, b, 1.0))
+
+def get_node_border_color(node):
     if getattr(node, "use_custom_color", False):
-        c = node.color; return _boost((c[0], c[1], c[2], 1.0))
+        c = node.color; return _boost_custom(c[0], c[1], c[2])
     bid = node.bl_idname
-    if bid in cache: return cache[bid]
-    if bid in EXACT_KEY:
-        key = EXACT_KEY[bid]
-    elif bid.startswith("ShaderNode"):
-        key = _key_shader(bid)
-    elif bid.startswith("GeometryNode"):
-        key = _key_geo(bid)
-    elif bid.startswith("CompositorNode"):
-        key = _key_comp(bid, getattr(node, "name", ""))
-    else:
-        key = "shader_node"
-    col = _boost(_safe_get(key, (0.8,0.8,0.8,1.0)))
-    cache[bid] = col
-    return col
+    if (key := CLASS_TABLE.get(bid)) is None: key = CLASS_TABLE[bid] = classify(bid, node.bl_rna.name)
+    return theme_color(key)
+
+_msgbus_owner = object()
+
+def _on_theme_changed():
+    _theme_colors.clear()
+
+def _subscribe():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    bpy.msgbus.subscribe_rna(key=_theme(), owner=_msgbus_owner, args=(), notify=_on_theme_changed, options={'PERSISTENT'})
+
+@bpy.app.handlers.persistent
+def _on_load(*args):
+    # Loading a file drops every msgbus subscription.
+    _theme_colors.clear(); _subscribe()
+
+def register():
+    build_class_table(); _subscribe()
+    bpy.app.handlers.load_post.append(_on_load)
+
+def unregister():
+    if _on_load in bpy.app.handlers.load_post: bpy.app.handlers.load_post.remove(_on_load)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    CLASS_TABLE.clear(); _theme_colors.clear(); _boost_custom.cache_clear()
@@ -0,0 +1,158 @@
+import numpy as np
+from functools import lru_cache
+
+BEZIER_MIN_SEGS = 8
+BEZIER_MAX_SEGS = 64
+BEZIER_SEG_LEN = 15.0
+BEZIER_LOD_PX = 4.0
+CORNER_SEG_PX = 10.0
+
+@lru_cache(maxsize=None)
+def bernstein_table(segs):
+    t = np.linspace(0.0, 1.0, segs + 1); u = 1.0 - t
+    return np.stack((u**3, 3 * u**2 * t, 3 * u * t**2, t**3), axis=1)
+
+def view_affine(v2d):
+    """(sx, sy, ox, oy) such that region = view * s + o, read once per frame."""
+    cx, cy = v2d.region_to_view(0.0, 0.0); kx, ky = v2d.region_to_view(1000.0, 1000.0)
+    sx, sy = 1000.0 / ((kx - cx) or 1.0), 1000.0 / ((ky - cy) or 1.0)
+    return sx, sy, -cx * sx, -cy * sy
+
+def link_control_points(ends, curving):
+    """Cubic control points (n, 4, 2) for links given as (n, 4) view-space x1, y1, x2, y2."""
+    ends = np.asarray(ends, dtype=np.float64).reshape(-1, 4)
+    x1, y1, x2, y2 = ends.T; dx, dy = x2 - x1, y2 - y1
+    h = np.where(dx >= 0, dx, np.hypot(dx, dy)) * curving
+    ctrl = np.empty((len(ends), 4, 2))
+    ctrl[:, 0, 0], ctrl[:, 0, 1] = x1, y1; ctrl[:, 1, 0], ctrl[:, 1, 1] = x1 + h, y1
+    ctrl[:, 2, 0], ctrl[:, 2, 1] = x2 - h, y2; ctrl[:, 3, 0], ctrl[:, 3, 1] = x2, y2
+    return ctrl
+
+def lod_segments(ctrl, scale):
+    """Segment count per curve from its on-screen length; ``scale`` is region pixels per view unit.
+
+    Short curves drop below BEZIER_MIN_SEGS down to one segment per BEZIER_LOD_PX pixels.
+    """
+    d = np.abs(ctrl[:, 3] - ctrl[:, 0]).sum(axis=1) * abs(scale)
+    floor = np.clip((d / BEZIER_LOD_PX).astype(np.int64), 2, BEZIER_MIN_SEGS)
+    return np.clip((d / BEZIER_SEG_LEN).astype(np.int64), floor, BEZIER_MAX_SEGS)
+
+def bezier_visible(ctrl, affine, bounds, pad=0.0):
+    """Cull curves whose control-point bounding box (which contains the curve) misses ``bounds`` in region space."""
+    sx, sy, ox, oy = affine; l, b, r, t = bounds
+    x = ctrl[..., 0] * sx + ox; y = ctrl[..., 1] * sy + oy
+    return (x.max(axis=1) >= l - pad) & (x.min(axis=1) <= r + pad) & (y.max(axis=1) >= b - pad) & (y.min(axis=1) <= t + pad)
+
+def rects_visible(rects, bounds, pad=0.0):
+    rects = np.asarray(rects, dtype=np.float64).reshape(-1, 4); l, b, r, t = bounds
+    return (rects[:, 2] >= l - pad) & (rects[:, 0] <= r + pad) & (rects[:, 3] >= b - pad) & (rects[:, 1] <= t + pad)
+
+def tessellate_links(ctrl, segs, affine):
+    """Evaluate every curve against a shared Bernstein table; returns one (segs + 1, 2) region-space array per link."""
+    sx, sy, ox, oy = affine
+    out = [None] * len(ctrl)
+    for n in np.unique(segs):
+        idx = np.nonzero(segs == n)[0]
+        pts = np.einsum('sk,nkd->nsd', bernstein_table(int(n)), ctrl[idx])
+        pts[..., 0] = pts[..., 0] * sx + ox; pts[..., 1] = pts[..., 1] * sy + oy
+        for i, p in zip(idx, pts.astype(np.float32)): out[i] = p
+    return out
+
+MITER_LIMIT = 4.0
+
+@lru_cache(maxsize=None)
+def corner_arc_table(seg):
+    """Unit arcs for the four corners (BR, TR, TL, BL), counter-clockwise, plus each point's corner side."""
+    a = np.concatenate([np.linspace(q * np.pi / 2 - np.pi / 2, q * np.pi / 2, seg + 1) for q in range(4)])
+    right = np.repeat([1.0, 1.0, 0.0, 0.0], seg + 1); top = np.repeat([0.0, 1.0, 1.0, 0.0], seg + 1)
+    return np.cos(a), np.sin(a), right, top
+
+def corner_segments(rects, max_seg=8):
+    """Corner resolution per rectangle from its smaller on-screen side."""
+    rects = np.asarray(rects, dtype=np.float64).reshape(-1, 4)
+    side = np.minimum(rects[:, 2] - rects[:, 0], rects[:, 3] - rects[:, 1])
+    return np.clip((side / CORNER_SEG_PX).astype(np.int64), 1, max_seg)
+
+def rounded_rects(rects, rad, seg=8):
+    """Outlines (n, 4 * (seg + 1), 2) for (n, 4) l, b, r, t rectangles, scaled from the cached corner template.
+
+    The radius is clamped to half the smaller side so tiny rectangles stay convex.
+    """
+    rects = np.asarray(rects, dtype=np.float64).reshape(-1, 4)
+    c, s, right, top = corner_arc_table(seg)
+    l, b, r, t = (rects[:, i:i + 1] for i in range(4))
+    rad = np.minimum(rad, np.minimum(r - l, t - b) * 0.5)
+    out = np.empty((len(rects), len(c), 2), dtype=np.float32)
+    out[..., 0] = l + rad + right * (r - l - 2 * rad) + c * rad
+    out[..., 1] = b + rad + top * (t - b - 2 * rad) + s * rad
+    return out
+
+def rounded_rects_lod(rects, rad, max_seg=8):
+    """Outlines for rectangles of mixed on-screen size, each with its own corner resolution.
+
+    Returns the outlines and the input row of each (outlines are grouped by resolution).
+    """
+    rects = np.asarray(rects, dtype=np.float64).reshape(-1, 4)
+    segs = corner_segments(rects, max_seg); out, order = [], []
+    for n in np.unique(segs):
+        idx = np.nonzero(segs == n)[0]; out.extend(rounded_rects(rects[idx], rad, int(n))); order.extend(idx.tolist())
+    return out, np.asarray(order, dtype=np.int64)
+
+def _segments(polys, closed):
+    P = np.concatenate(polys).astype(np.float64)
+    lens = np.fromiter((len(p) for p in polys), dtype=np.int64, count=len(polys))
+    starts = np.concatenate(([0], np.cumsum(lens)[:-1]))
+    # Repeated points (clamped corner arcs meet in one) would give zero-length segments without a normal.
+    prev = np.arange(len(P)) - 1; first = starts[lens > 0]
+    prev[first] = first + lens[lens > 0] - 1 if closed else first
+    keep = (P != P[prev]).any(axis=1); keep[first] |= not closed
+    if not keep.all():
+        P = P[keep]; lens = np.bincount(np.repeat(np.arange(len(polys)), lens)[keep], minlength=len(polys))
+        starts = np.concatenate(([0], np.cumsum(lens)[:-1]))
+    nseg = np.where(lens > 1, lens if closed else lens - 1, 0)
+    seg_poly = np.repeat(np.arange(len(polys)), nseg)
+    j = np.arange(len(seg_poly)) - np.repeat(np.cumsum(nseg) - nseg, nseg)
+    a = starts[seg_poly] + j; b = starts[seg_poly] + (j + 1) % lens[seg_poly]
+    return P, a, b, seg_poly, lens
+
+def line_segments(polys, closed=False):
+    """LINES vertex pairs (V, 2) and owning polyline index per vertex for many polylines at once."""
+    if not len(polys): return np.empty((0, 2), np.float32), np.empty(0, np.int64)
+    P, a, b, seg_poly, _ = _segments(polys, closed)
+    return np.stack((P[a], P[b]), axis=1).reshape(-1, 2).astype(np.float32), np.repeat(seg_poly, 2)
+
+def stroke_polylines(polys, width, closed=False, miter_limit=MITER_LIMIT):
+    """Expand many polylines into one TRIS buffer with miter joins (bevel past ``miter_limit``).
+
+    ``width`` is a scalar or one value per polyline. Returns (V, 2) float32 vertices
+    and the owning polyline index of every vertex, for per-vertex attributes.
+    """
+    if not len(polys): return np.empty((0, 2), np.float32), np.empty(0, np.int64)
+    P, a, b, seg_poly, lens = _segments(polys, closed)
+    hw = np.broadcast_to(np.asarray(width, dtype=np.float64) * 0.5, (len(polys),))
+    hw_pt = np.repeat(hw, lens)[:, None]
+    d = P[b] - P[a]; L = np.hypot(d[:, 0], d[:, 1]); d /= np.where(L > 0, L, 1.0)[:, None]
+    n = np.stack((-d[:, 1], d[:, 0]), axis=1)
+    seg_in = np.full(len(P), -1); seg_out = np.full(len(P), -1)
+    seg_in[b] = np.arange(len(a)); seg_out[a] = np.arange(len(a))
+    has_in, has_out = seg_in >= 0, seg_out >= 0
+    n_in = np.where(has_in[:, None], n[seg_in], n[seg_out]); n_out = np.where(has_out[:, None], n[seg_out], n_in)
+    m = n_in + n_out; ml = np.hypot(m[:, 0], m[:, 1])
+    m /= np.where(ml > 0, ml, 1.0)[:, None]
+    cos_half = np.einsum('ij,ij->i', m, n_in)
+    bevel = cos_half < 1.0 / miter_limit
+    miter = m * (hw_pt / np.where(bevel, 1.0, cos_half)[:, None])
+    off_in = np.where(bevel[:, None], n_in * hw_pt, miter); off_out = np.where(bevel[:, None], n_out * hw_pt, miter)
+    A, B = P[a], P[b]
+    quads = np.stack((A - off_out[a], A + off_out[a], B + off_in[b], A - off_out[a], B + off_in[b], B - off_in[b]), axis=1)
+    joins = np.nonzero(bevel & has_in & has_out)[0]
+    if len(joins):
+        di, do = d[seg_in[joins]], d[seg_out[joins]]
+        side = np.where(di[:, 0] * do[:, 1] - di[:, 1] * do[:, 0] > 0, -1.0, 1.0)[:, None] * hw_pt[joins]
+        J = P[joins]
+        tris = np.stack((J, J + n_in[joins] * side, J + n_out[joins] * side), axis=1)
+        point_poly = np.repeat(np.arange(len(polys)), lens)
+        verts = np.concatenate((quads.reshape(-1, 2), tris.reshape(-1, 2)))
+        owner = np.concatenate((np.repeat(seg_poly, 6), np.repeat(point_poly[joins], 3)))
+    else: verts, owner = quads.reshape(-1, 2), np.repeat(seg_poly, 6)
+    return verts.astype(np.float32), owner
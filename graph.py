@@ -0,0 +1,538 @@
+import bpy
+from array import array
+from collections import deque, OrderedDict
+
+_tree_versions = {}
+_epoch = 0
+_graphs = {}
+_interfaces = {}
+GROUP_IDNAMES = {'ShaderNodeGroup', 'GeometryNodeGroup', 'CompositorNodeGroup'}
+CONE_MEMO_LIMIT = 4096
+DIST_MEMO_LIMIT = 256
+BUILD_CHUNK = 512
+# Nodes whose result leaves the tree; everything that reaches none of them is dead.
+OUTPUT_IDNAMES = {'ShaderNodeOutputMaterial', 'ShaderNodeOutputWorld', 'ShaderNodeOutputLight', 'ShaderNodeOutputAOV',
+                  'ShaderNodeOutputLineStyle', 'NodeGroupOutput', 'GeometryNodeViewer', 'CompositorNodeComposite',
+                  'CompositorNodeViewer', 'CompositorNodeSplitViewer', 'CompositorNodeOutputFile', 'TextureNodeOutput',
+                  'TextureNodeViewer'}
+
+def tree_version(tree):
+    return _epoch, _tree_versions.get(tree.as_pointer(), 0)
+
+def tag_tree_changed(tree):
+    p = tree.as_pointer(); _tree_versions[p] = _tree_versions.get(p, 0) + 1
+
+def _owned_tree(id_data):
+    if isinstance(id_data, bpy.types.NodeTree): return id_data
+    return getattr(id_data, "node_tree", None)
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    for upd in depsgraph.updates:
+        try: tree = _owned_tree(upd.id.original)
+        except ReferenceError: continue
+        if tree is not None: tag_tree_changed(tree)
+
+@bpy.app.handlers.persistent
+def _on_reset(*args):
+    global _epoch
+    _epoch += 1; _tree_versions.clear(); _graphs.clear(); _interfaces.clear()
+
+def _lru_put(cache, key, value, limit):
+    cache[key] = value
+    if len(cache) > limit: cache.popitem(last=False)
+    return value
+
+class TreeGraph:
+    """Link topology of one node tree with reroute chains collapsed.
+
+    Sockets, nodes and links get dense integer ids. ``out_off``/``out_links``
+    is the raw CSR adjacency (socket -> outgoing links); ``fan_off``,
+    ``fan_links`` and ``tgt_off``/``tgt_sids`` hold, for every chain source
+    socket, all links of its reroute-collapsed fan-out and the non-reroute
+    input sockets it ends at.
+    """
+    __slots__ = ("key", "sid", "ptrs", "sockets", "sock_node", "is_out", "nodes", "reroute", "rr_in", "rr_out",
+                 "links", "link_from", "link_to", "in_link", "out_off", "out_links", "src", "cyclic",
+                 "fan_off", "fan_links", "tgt_off", "tgt_sids", "_memo", "_cones", "_dists")
+
+    def __init__(self, tree, key=None):
+        self.key = key
+        for _ in self._build(tree): pass
+
+    def _build(self, tree):
+        """Fill the graph from ``tree``, yielding every BUILD_CHUNK items so the work can be spread out."""
+        sid, ptrs, sockets, sock_node, is_out = {}, array('Q'), [], array('i'), bytearray()
+        nid, nodes, reroute = {}, [], bytearray()
+        links, link_from, link_to = [], array('i'), array('i')
+
+        def node_id(nd):
+            p = nd.as_pointer()
+            if (i := nid.get(p)) is None:
+                i = nid[p] = len(nodes); nodes.append(nd); reroute.append(nd.bl_idname == 'NodeReroute')
+            return i
+
+        def sock_id(s, n, out):
+            p = s.as_pointer()
+            if (i := sid.get(p)) is None:
+                i = sid[p] = len(sockets); ptrs.append(p); sockets.append(s); sock_node.append(n); is_out.append(out)
+            return i
+
+        for i, lk in enumerate(tree.links, 1):
+            link_from.append(sock_id(lk.from_socket, node_id(lk.from_node), 1))
+            link_to.append(sock_id(lk.to_socket, node_id(lk.to_node), 0))
+            links.append(lk)
+            if not i % BUILD_CHUNK: yield
+        rr_in, rr_out = {}, {}
+        for n in range(len(nodes)):
+            if reroute[n] and nodes[n].inputs and nodes[n].outputs:
+                rr_in[n] = sock_id(nodes[n].inputs[0], n, 0); rr_out[n] = sock_id(nodes[n].outputs[0], n, 1)
+            if not (n + 1) % BUILD_CHUNK: yield
+
+        ns, nl = len(sockets), len(links)
+        in_link = array('i', [-1]) * ns
+        out_off = array('i', [0]) * (ns + 1)
+        for l in range(nl):
+            out_off[link_from[l] + 1] += 1
+            if in_link[link_to[l]] < 0: in_link[link_to[l]] = l
+            if not (l + 1) % BUILD_CHUNK: yield
+        for s in range(ns):
+            out_off[s + 1] += out_off[s]
+            if not (s + 1) % BUILD_CHUNK: yield
+        fill = array('i', out_off[:ns]); out_links = array('i', [0]) * nl
+        for l in range(nl):
+            s = link_from[l]; out_links[fill[s]] = l; fill[s] += 1
+            if not (l + 1) % BUILD_CHUNK: yield
+
+        self.sid, self.ptrs, self.sockets, self.sock_node, self.is_out = sid, ptrs, sockets, sock_node, is_out
+        self._memo, self._cones, self._dists = {}, OrderedDict(), OrderedDict()
+        self.nodes, self.reroute, self.rr_in, self.rr_out = nodes, reroute, rr_in, rr_out
+        self.links, self.link_from, self.link_to, self.in_link = links, link_from, link_to, in_link
+        self.out_off, self.out_links = out_off, out_links
+        self.src = array('i', [-2]) * ns; self.cyclic = bytearray(ns)
+
+        fan_off, fan_links, tgt_off, tgt_sids = array('i', [0]), array('i'), array('i', [0]), array('i')
+        roots = set()
+        for s in range(ns):
+            roots.add(self.source(s))
+            if not (s + 1) % BUILD_CHUNK: yield
+        for s in range(ns):
+            if s in roots:
+                fl, ft = self._walk(s); fan_links.extend(fl); tgt_sids.extend(ft)
+            fan_off.append(len(fan_links)); tgt_off.append(len(tgt_sids))
+            if not (s + 1) % BUILD_CHUNK: yield
+        self.fan_off, self.fan_links, self.tgt_off, self.tgt_sids = fan_off, fan_links, tgt_off, tgt_sids
+
+    def source(self, s):
+        """Ultimate source socket of ``s`` with reroutes collapsed (memoized)."""
+        src = self.src
+        if src[s] != -2: return src[s]
+        cur, path = s, [s]
+        if not self.is_out[cur]:
+            if (l := self.in_link[cur]) < 0: src[s] = cur; return cur
+            cur = self.link_from[l]; path.append(cur)
+        seen, cyc = {cur}, 0
+        while self.reroute[n := self.sock_node[cur]] and n in self.rr_in:
+            if src[cur] != -2: cyc = self.cyclic[cur]; cur = src[cur]; break
+            if (l := self.in_link[self.rr_in[n]]) < 0: break
+            nxt = self.link_from[l]
+            if nxt in seen: cyc = 1; break
+            seen.add(nxt); path.append(nxt); cur = nxt
+        for p in path: src[p] = cur; self.cyclic[p] = cyc
+        return cur
+
+    def _walk(self, s):
+        out_off, out_links, link_to, sock_node = self.out_off, self.out_links, self.link_to, self.sock_node
+        reroute, rr_out = self.reroute, self.rr_out
+        q, seen, fl, ft, i = [s], {s}, [], [], 0
+        while i < len(q):
+            c = q[i]; i += 1
+            for l in out_links[out_off[c]:out_off[c + 1]]:
+                fl.append(l); t = link_to[l]; n = sock_node[t]
+                if reroute[n]:
+                    if (o := rr_out.get(n)) is not None and o not in seen: seen.add(o); q.append(o)
+                else: ft.append(t)
+        return fl, ft
+
+    def fan_out(self, s):
+        """(link ids, target socket ids) reached downstream of ``s`` through reroutes."""
+        if self.source(s) == s: return self.fan_links[self.fan_off[s]:self.fan_off[s + 1]], self.tgt_sids[self.tgt_off[s]:self.tgt_off[s + 1]]
+        return self._walk(s)
+
+    def chain(self, s, through_groups=False):
+        return drain(self.iter_chain(s, through_groups))
+
+    def iter_chain(self, s, through_groups=False):
+        """(link ids, target node ids, source socket id) of the reroute-collapsed chain through socket ``s``.
+
+        With ``through_groups`` the chain continues out of group nodes whose input is
+        passed straight through to a Group Output inside the group. Group interfaces
+        not built yet are built step by step, yielding like ``iter_tree_graph``.
+        """
+        src = self.source(s); fl, ft = self.fan_out(src)
+        if through_groups:
+            yield from self._iter_group_flags(); yield from self._iter_node_sockets()
+            fl, ft, seen, i = list(fl), list(ft), {src}, 0
+            while i < len(ft):
+                t = ft[i]; i += 1; n = self.sock_node[t]
+                if (inner := self._group_tree(n)) is None: continue
+                yield from iter_group_interface(inner)
+                if (iface := self.group_interface(n)) is None: continue
+                for o in self._passthrough(t, iface):
+                    if o not in seen: seen.add(o); f2, t2 = self.fan_out(o); fl.extend(f2); ft.extend(t2)
+        return fl, list(dict.fromkeys(self.sock_node[t] for t in ft)), src
+
+    def socket_ident(self, s):
+        idents = self._memo.setdefault("ident", {})
+        if (ident := idents.get(s)) is None: ident = idents[s] = self.sockets[s].identifier
+        return ident
+
+    def node_sockets(self, n, out):
+        """Socket ids of node ``n`` present in the graph, by identifier."""
+        if (per_node := self._memo.get("node_sockets")) is None: per_node = drain(self._iter_node_sockets())
+        return {self.socket_ident(s): s for s in per_node.get((n, out), ())}
+
+    def _iter_node_sockets(self):
+        if (per_node := self._memo.get("node_sockets")) is not None: return per_node
+        per_node, sock_node, is_out = {}, self.sock_node, self.is_out
+        for s in range(len(self.sockets)):
+            per_node.setdefault((sock_node[s], is_out[s]), []).append(s)
+            if not (s + 1) % BUILD_CHUNK: yield
+        self._memo["node_sockets"] = per_node
+        return per_node
+
+    def _group_tree(self, n):
+        if (flags := self._memo.get("is_group")) is None: flags = drain(self._iter_group_flags())
+        return self.nodes[n].node_tree if flags[n] else None
+
+    def _iter_group_flags(self):
+        if (flags := self._memo.get("is_group")) is not None: return flags
+        flags = bytearray(len(self.nodes))
+        for n, nd in enumerate(self.nodes):
+            flags[n] = nd.bl_idname in GROUP_IDNAMES
+            if not (n + 1) % BUILD_CHUNK: yield
+        self._memo["is_group"] = flags
+        return flags
+
+    def group_interface(self, n):
+        """GroupInterface of group node ``n``, or None for any other node."""
+        return None if (inner := self._group_tree(n)) is None else get_group_interface(inner)
+
+    def _passthrough(self, t, iface):
+        outs = self.node_sockets(self.sock_node[t], 1)
+        return [outs[e] for e in iface.exits.get(self.socket_ident(t), ()) if e in outs]
+
+    def deep_targets(self, s, _seen=None):
+        """Consumers of output socket ``s`` as (group path, socket), descending into node groups.
+
+        The group path is the tuple of group nodes entered from this tree. Also
+        returns the identifiers of this tree's Group Output sockets the chain reaches.
+        """
+        seen = set() if _seen is None else _seen
+        if s in seen: return [], []
+        seen.add(s); targets, exits = [], []
+        for t in self.fan_out(s)[1]:
+            n = self.sock_node[t]; nd = self.nodes[n]
+            if nd.bl_idname == 'NodeGroupOutput': exits.append(self.socket_ident(t)); continue
+            iface = self.group_interface(n); ident = self.socket_ident(t) if iface else None
+            if iface is None or not (iface.targets.get(ident) or iface.exits.get(ident)):
+                targets.append(((), self.sockets[t])); continue
+            targets.extend(((nd,) + path, sock) for path, sock in iface.targets.get(ident, ()))
+            for o in self._passthrough(t, iface):
+                t2, e2 = self.deep_targets(o, seen); targets.extend(t2); exits.extend(e2)
+        return targets, exits
+
+    def deep_source(self, s, _seen=None):
+        """(group path, socket, entry) feeding input socket ``s``, descending into group outputs.
+
+        ``entry`` is the identifier of this tree's Group Input socket (with socket None)
+        when the value enters from outside; None when nothing is linked or on cycles.
+        """
+        seen = set() if _seen is None else _seen
+        if s in seen or (not self.is_out[s] and self.in_link[s] < 0): return None
+        seen.add(s); src = self.source(s)
+        if self.cyclic[s]: return None
+        n = self.sock_node[src]; nd = self.nodes[n]
+        if nd.bl_idname == 'NodeGroupInput': return (), None, self.socket_ident(src)
+        if (iface := self.group_interface(n)) is not None and (inner := iface.sources.get(self.socket_ident(src))):
+            path, sock, entry = inner
+            if sock is not None: return (nd,) + path, sock, None
+            if (i := self.node_sockets(n, 0).get(entry)) is not None and (res := self.deep_source(i, seen)): return res
+        return (), self.sockets[src], None
+
+    def link_hidden(self):
+        if (res := self._memo.get("link_hidden")) is None: res = drain(self.iter_link_hidden())
+        return res
+
+    def iter_link_hidden(self):
+        if (res := self._memo.get("link_hidden")) is not None: return res
+        res = bytearray(len(self.links))
+        for l, lk in enumerate(self.links):
+            res[l] = lk.is_hidden
+            if not (l + 1) % BUILD_CHUNK: yield
+        self._memo["link_hidden"] = res
+        return res
+
+    def link_muted(self):
+        if (res := self._memo.get("link_muted")) is None: res = self._memo["link_muted"] = bytearray(lk.is_muted for lk in self.links)
+        return res
+
+    def dead_analysis(self):
+        """(dead node ids, dead output socket ids) among the linked nodes.
+
+        One reverse sweep from every output node over the incoming-link CSR marks the
+        live nodes; muted links carry nothing. A dead output is a linked socket of a
+        live node whose links all end in dead nodes or are muted.
+        """
+        if (res := self._memo.get("dead")) is not None: return res
+        nn, sock_node, link_from, link_to = len(self.nodes), self.sock_node, self.link_from, self.link_to
+        off, adj = self._node_links(True); muted = self.link_muted()
+        alive = bytearray(nn); q = [n for n in range(nn) if self.nodes[n].bl_idname in OUTPUT_IDNAMES]
+        for n in q: alive[n] = 1
+        for n in q:
+            for l in adj[off[n]:off[n + 1]]:
+                if not muted[l] and not alive[m := sock_node[link_from[l]]]: alive[m] = 1; q.append(m)
+        dead_nodes = [n for n in range(nn) if not alive[n] and not self.reroute[n]]
+        out_off, out_links = self.out_off, self.out_links
+        dead_outs = [s for s in range(len(self.sockets)) if self.is_out[s] and alive[sock_node[s]] and not self.reroute[sock_node[s]]
+                     and out_off[s] < out_off[s + 1]
+                     and all(muted[l] or not alive[sock_node[link_to[l]]] for l in out_links[out_off[s]:out_off[s + 1]])]
+        res = self._memo["dead"] = (dead_nodes, dead_outs)
+        return res
+
+    def _node_links(self, upstream):
+        """CSR node -> incoming (``upstream``) or outgoing link ids."""
+        if (res := self._memo.get(("node_links", upstream))) is None: res = drain(self._iter_node_links(upstream))
+        return res
+
+    def _iter_node_links(self, upstream):
+        if (res := self._memo.get(("node_links", upstream))) is not None: return res
+        near = self.link_to if upstream else self.link_from; sock_node = self.sock_node; nl = len(self.links)
+        off = array('i', [0]) * (len(self.nodes) + 1)
+        for l in range(nl):
+            off[sock_node[near[l]] + 1] += 1
+            if not (l + 1) % BUILD_CHUNK: yield
+        for n in range(len(self.nodes)):
+            off[n + 1] += off[n]
+            if not (n + 1) % BUILD_CHUNK: yield
+        fill = array('i', off[:-1]); links = array('i', [0]) * nl
+        for l in range(nl):
+            n = sock_node[near[l]]; links[fill[n]] = l; fill[n] += 1
+            if not (l + 1) % BUILD_CHUNK: yield
+        res = self._memo[("node_links", upstream)] = (off, links)
+        return res
+
+    def node_cone(self, n, upstream=False, limit=0):
+        return drain(self.iter_node_cone((n,), upstream, limit))
+
+    def iter_node_cone(self, starts, upstream=False, limit=0, depth=0):
+        """Hop depth of every node and link reachable from the nodes ``starts`` (0 = no depth limit).
+
+        One multi-source 0-1 BFS with every start at ``depth``: entering a reroute costs
+        no hop, so depths count real nodes only; a link's depth is its near node's depth
+        + 1. Cycle-safe and memoized per start set, so every socket of a chain reuses its
+        cone. Yields every BUILD_CHUNK visits and returns the (nodes, links) result.
+        """
+        key = (tuple(sorted(set(starts))), upstream, limit, depth)
+        if (res := self._cones.get(key)) is not None: self._cones.move_to_end(key); return res
+        off, adj = yield from self._iter_node_links(upstream)
+        far = self.link_from if upstream else self.link_to; sock_node, reroute = self.sock_node, self.reroute
+        nodes = dict.fromkeys(key[0], depth); links, q, visits = {}, deque((depth, n) for n in key[0]), 0
+        while q:
+            visits += 1
+            if not visits % BUILD_CHUNK: yield
+            d, c = q.popleft()
+            if d > nodes[c]: continue
+            for l in adj[off[c]:off[c + 1]]:
+                if limit and d + 1 > limit: break
+                if d + 1 < links.get(l, d + 2): links[l] = d + 1
+                m = sock_node[far[l]]; w = not reroute[m]
+                if d + w < nodes.get(m, d + 2):
+                    nodes[m] = d + w
+                    if w: q.append((d + 1, m))
+                    else: q.appendleft((d, m))
+        return _lru_put(self._cones, key, (nodes, links), CONE_MEMO_LIMIT)
+
+    def node_index(self):
+        """Node pointer -> node id."""
+        if (res := self._memo.get("node_index")) is None: res = self._memo["node_index"] = {nd.as_pointer(): i for i, nd in enumerate(self.nodes)}
+        return res
+
+    def node_distances(self, n):
+        """Hop distance from node ``n`` to every node connected to it, ignoring link direction.
+
+        Reroutes add no hop, as in ``node_cone``.
+        """
+        if (res := self._dists.get(n)) is not None: self._dists.move_to_end(n); return res
+        adj = (self._node_links(True), self._node_links(False)); ends = (self.link_from, self.link_to)
+        sock_node, reroute = self.sock_node, self.reroute
+        dist, q = {n: 0}, deque([(0, n)])
+        while q:
+            d, c = q.popleft()
+            if d > dist[c]: continue
+            for (off, links), far in zip(adj, ends):
+                for l in links[off[c]:off[c + 1]]:
+                    m = sock_node[far[l]]; w = not reroute[m]
+                    if d + w < dist.get(m, d + 2):
+                        dist[m] = d + w
+                        if w: q.append((d + 1, m))
+                        else: q.appendleft((d, m))
+        return _lru_put(self._dists, n, dist, DIST_MEMO_LIMIT)
+
+    def dependency_cone(self, s, upstream=True, downstream=True, limit=0):
+        return drain(self.iter_dependency_cone(s, upstream, downstream, limit))
+
+    def iter_dependency_cone(self, s, upstream=True, downstream=True, limit=0):
+        """Node and link hop depths of the transitive cone around the chain through socket ``s``.
+
+        Downstream is one BFS seeded with every chain target at depth 1, upstream one
+        from the chain source at depth 0, so the cost is the cone size however many
+        targets share it. Yields while cones are being walked and returns (nodes, links).
+        """
+        fl, targets, src = self.chain(s); nodes, links = {}, {}
+        if downstream and targets and limit != 1: nodes, links = yield from self.iter_node_cone(targets, False, limit, 1)
+        if upstream:
+            up_nodes, up_links = yield from self.iter_node_cone((self.sock_node[src],), True, limit)
+            if not nodes: return up_nodes, up_links
+            nodes, links, visits = dict(nodes), dict(links), 0
+            for part, up in ((nodes, up_nodes), (links, up_links)):
+                for k, d in up.items():
+                    visits += 1
+                    if not visits % BUILD_CHUNK: yield
+                    if d < part.get(k, d + 1): part[k] = d
+        return nodes, links
+
+    def link_fanout(self):
+        """Number of collapsed targets fed by the chain each link belongs to."""
+        if (res := self._memo.get("link_fanout")) is None:
+            off, link_from = self.tgt_off, self.link_from
+            res = self._memo["link_fanout"] = [off[(s := self.source(link_from[l])) + 1] - off[s] for l in range(len(self.links))]
+        return res
+
+    def node_depths(self):
+        """Hop depth of every node from the tree's sources; reroutes do not add a hop.
+
+        Nodes on a cycle keep the depth reached before the cycle closes.
+        """
+        if (res := self._memo.get("node_depths")) is not None: return res
+        nn, sock_node, reroute = len(self.nodes), self.sock_node, self.reroute
+        indeg, out = [0] * nn, [[] for _ in range(nn)]
+        for l in range(len(self.links)):
+            b = sock_node[self.link_to[l]]; out[sock_node[self.link_from[l]]].append(b); indeg[b] += 1
+        depth = [0] * nn; q = [n for n in range(nn) if not indeg[n]]
+        for n in q:
+            for m in out[n]:
+                if (d := depth[n] + (not reroute[m])) > depth[m]: depth[m] = d
+                indeg[m] -= 1
+                if not indeg[m]: q.append(m)
+        res = self._memo["node_depths"] = depth
+        return res
+
+    def link_depth(self):
+        depth, sock_node, link_from = self.node_depths(), self.sock_node, self.link_from
+        return [depth[sock_node[link_from[l]]] for l in range(len(self.links))]
+
+def drain(steps):
+    """Run a step generator to completion and return its result."""
+    while True:
+        try: next(steps)
+        except StopIteration as done: return done.value
+
+def _graph_key(tree):
+    return tree_version(tree), len(tree.nodes), len(tree.links)
+
+def get_tree_graph(tree):
+    key = _graph_key(tree)
+    p = tree.as_pointer()
+    if (g := _graphs.get(p)) is None or g.key != key: g = _graphs[p] = TreeGraph(tree, key)
+    return g
+
+def peek_tree_graph(tree):
+    """The cached graph of ``tree`` if it is current, else None; never builds."""
+    g = _graphs.get(tree.as_pointer())
+    return g if g is not None and g.key == _graph_key(tree) else None
+
+def iter_tree_graph(tree):
+    """Step form of get_tree_graph: yields between build chunks and returns the graph.
+
+    The tree is re-checked before every resume; if it changed, the partial build is
+    dropped before touching RNA again and starts over.
+    """
+    while True:
+        key = _graph_key(tree); p = tree.as_pointer()
+        if (g := _graphs.get(p)) is not None and g.key == key: return g
+        g = TreeGraph.__new__(TreeGraph); g.key = key
+        for _ in g._build(tree):
+            yield
+            if _graph_key(tree) != key: break
+        else:
+            _graphs[p] = g; return g
+
+class GroupInterface:
+    """How one node group's interface sockets connect inside it, keyed by socket identifier.
+
+    ``targets``: (group path, socket) consumers of each Group Input socket, nested groups resolved.
+    ``exits``: Group Output identifiers each Group Input socket passes straight through to.
+    ``sources``: deep_source result feeding each Group Output socket.
+    Built once per group state, so crossing a group boundary is a dict lookup.
+    """
+    __slots__ = ("key", "targets", "exits", "sources")
+
+    def __init__(self, tree, key=None):
+        self.key = key; self.targets, self.exits, self.sources = {}, {}, {}
+        _interfaces[tree.as_pointer()] = self  # guards against recursive groups while building
+        g = get_tree_graph(tree)
+        for n, nd in enumerate(g.nodes):
+            if nd.bl_idname == 'NodeGroupInput':
+                for ident, s in g.node_sockets(n, 1).items():
+                    t, e = g.deep_targets(s)
+                    self.targets.setdefault(ident, []).extend(t); self.exits.setdefault(ident, []).extend(e)
+            elif nd.bl_idname == 'NodeGroupOutput' and getattr(nd, "is_active_output", True):
+                for ident, s in g.node_sockets(n, 0).items():
+                    if (res := g.deep_source(s)) is not None: self.sources[ident] = res
+
+def get_group_interface(tree):
+    key = _graph_key(tree)
+    p = tree.as_pointer()
+    if (gi := _interfaces.get(p)) is None or gi.key != key: gi = GroupInterface(tree, key)
+    return gi
+
+def iter_group_interface(tree, _building=None):
+    """Step form of get_group_interface.
+
+    The group's graph and the interfaces of the groups nested in it are built first,
+    yielding between chunks, so the final assembly only reads caches.
+    """
+    if (gi := _interfaces.get(p := tree.as_pointer())) is not None and gi.key == _graph_key(tree): return gi
+    building = set() if _building is None else _building; building.add(p)
+    g = yield from iter_tree_graph(tree)
+    yield from g._iter_group_flags(); yield from g._iter_node_sockets()
+    for n in range(len(g.nodes)):
+        if (inner := g._group_tree(n)) is not None and inner.as_pointer() not in building:
+            yield from iter_group_interface(inner, building)
+        if not (n + 1) % BUILD_CHUNK: yield
+    yield
+    return get_group_interface(tree)
+
+_NEVER_DEAD = OUTPUT_IDNAMES | {'NodeFrame', 'NodeReroute'}
+
+def find_dead_nodes(tree):
+    """(dead nodes, dead output socket pointers) of ``tree``, unlinked nodes included; cached per tree state."""
+    g = get_tree_graph(tree)
+    if (res := g._memo.get("dead_nodes")) is None:
+        dead_nodes, dead_outs = g.dead_analysis(); linked = {nd.as_pointer() for nd in g.nodes}
+        nodes = [g.nodes[n] for n in dead_nodes]
+        nodes += [nd for nd in tree.nodes if nd.bl_idname not in _NEVER_DEAD and nd.as_pointer() not in linked]
+        res = g._memo["dead_nodes"] = (nodes, [g.ptrs[s] for s in dead_outs])
+    return res
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    for h in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post):
+        h.append(_on_reset)
+
+def unregister():
+    for h, f in ((bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update), (bpy.app.handlers.undo_post, _on_reset),
+                 (bpy.app.handlers.redo_post, _on_reset), (bpy.app.handlers.load_post, _on_reset)):
+        if f in h: h.remove(f)
+    _graphs.clear(); _interfaces.clear()
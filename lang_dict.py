@@ -1,18 +1,30 @@
 LANG_DICT = {
     "en": {
         "highlighter_hotkey": "Highlighter Hotkey",
+        "overview_hotkey": "Link Overview Hotkey",
+        "search_hotkey": "Search and Jump Hotkey",
+        "profiling": "Profiling HUD",
+        "profile_export": "Export Samples",
         "hotkey_not_initialized": "Hotkey not initialized.",
         "sources": "Sources (Upstream):",
         "targets": "Targets (Downstream):",
         "none": "(None)",
+        "used_in": "Group Used In:",
+        "indexing": "Indexing…",
         "jump_to_node": "Jump to Node",
     },
     "zh_HANS": {
         "highlighter_hotkey": "高亮器快捷键",
+        "overview_hotkey": "连线总览快捷键",
+        "search_hotkey": "搜索跳转快捷键",
+        "profiling": "性能分析面板",
+        "profile_export": "导出采样",
         "hotkey_not_initialized": "快捷键尚未初始化。",
         "sources": "来源（上游）：",
         "targets": "目标（下游）：",
         "none": "（无）",
+        "used_in": "节点组使用位置：",
+        "indexing": "正在建立索引…",
         "jump_to_node": "跳转节点",
     }
 }
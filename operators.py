@@ -1,276 +1,710 @@
-import bpy, gpu, ctypes
+import bpy, gpu, time
+import numpy as np
 from gpu_extras.batch import batch_for_shader
-from math import sin, cos, pi, sqrt
-from collections import deque
-from itertools import chain
+from itertools import chain, islice
 from .lang_dict import LANG_DICT
 
-from .colors import get_node_border_color
+from .colors import get_node_border_color, socket_color
+from .geometry import (view_affine, link_control_points, lod_segments, tessellate_links, bezier_visible, rects_visible,
+                       rounded_rects_lod, stroke_polylines, line_segments)
+from .overview import LinkOverview, overview_shader, ramp_colors
+from .spatial import iter_node_grid, node_view_bounds, view_per_px
+from .graph import get_tree_graph, peek_tree_graph, iter_tree_graph, tree_version, find_dead_nodes, GROUP_IDNAMES
+from .usage import group_users, owner_tree, tree_owner
+from .search import get_node_index, node_distances, search_nodes
+from .sockets import read_socket_locations, select_layout
 
-def _tri_strip_polyline(pts, width):
-    n = len(pts)
-    if n < 2:
-        return None
-    hw = width * 0.5
-    out = []
-    for i in range(n):
-        if i == 0:
-            x0, y0 = pts[0]; x1, y1 = pts[1]
-            tx, ty = x1 - x0, y1 - y0
-        elif i == n - 1:
-            x0, y0 = pts[-2]; x1, y1 = pts[-1]
-            tx, ty = x1 - x0, y1 - y0
-        else:
-            x0, y0 = pts[i - 1]; x1, y1 = pts[i + 1]
-            tx, ty = x1 - x0, y1 - y0
-        L = (tx * tx + ty * ty) ** 0.5 or 1.0
-        nx, ny = -ty / L * hw, tx / L * hw
-        x, y = pts[i]
-        out.extend([(x - nx, y - ny), (x + nx, y + ny)])
-    return out
+line_thickness = 2.0
 
-def _tri_strip_polygon(pts, width):
-    n = len(pts)
-    if n < 3:
-        return None
-    hw = width * 0.5
-    out = []
-    for i in range(n):
-        x0, y0 = pts[i - 1]
-        x1, y1 = pts[(i + 1) % n]
-        tx, ty = x1 - x0, y1 - y0
-        L = (tx * tx + ty * ty) ** 0.5 or 1.0
-        nx, ny = -ty / L * hw, tx / L * hw
-        x, y = pts[i]
-        out.extend([(x - nx, y - ny), (x + nx, y + ny)])
-    return out
+def link_curves(tree, link_ptrs, curving):
+    """View-space control points for links given as (n, 2) from/to socket pointers, and the row each came from."""
+    if not len(link_ptrs): return np.empty((0, 4, 2)), np.empty(0, np.int64)
+    locs, valid = read_socket_locations(np.asarray(link_ptrs).ravel(), tree)
+    ok = np.nonzero(valid.reshape(-1, 2).all(axis=1))[0]
+    return link_control_points(locs.reshape(-1, 4)[ok], curving), ok
 
+def bezier_verts_from_links(ctrl, rows, affine, bounds, pad=0.0):
+    """Region-space polylines for the on-screen curves among ``ctrl``; returns them and their ``rows``."""
+    vis = bezier_visible(ctrl, affine, bounds, pad); ctrl = ctrl[vis]
+    return tessellate_links(ctrl, lod_segments(ctrl, affine[0]), affine), rows[vis]
 
-line_thickness = 2.0
+def _theme_curving():
+    try: return bpy.context.preferences.themes[0].node_editor.noodle_curving / 10.0
+    except: return 0.5
 
-class StructBase(ctypes.Structure):
-    _subclasses=[]; __annotations__={}
-    def __init_subclass__(cls): cls._subclasses.append(cls)
-    @staticmethod
-    def _init_structs():
-        ft=type(lambda:None)
-        for cls in StructBase._subclasses:
-            fields=[]
-            for k,v in cls.__annotations__.items():
-                if isinstance(v,ft): v=v()
-                fields.append((k,v))
-            if fields: cls._fields_=fields
-            cls.__annotations__.clear()
-        StructBase._subclasses.clear()
-
-class BNodeSocketRuntimeHandle(StructBase):
-    _pad0: ctypes.c_char*8; declaration: ctypes.c_void_p; changed_flag: ctypes.c_uint32
-    total_inputs: ctypes.c_short; _pad1: ctypes.c_char*2; location: ctypes.c_float*2
-class BNodeStack(StructBase):
-    vec: ctypes.c_float*4; min: ctypes.c_float; max: ctypes.c_float
-    data: ctypes.c_void_p; hasinput: ctypes.c_short; hasoutput: ctypes.c_short
-    datatype: ctypes.c_short; sockettype: ctypes.c_short; is_copy: ctypes.c_short
-    external: ctypes.c_short; _pad: ctypes.c_char*4
-class BNodeSocket(StructBase):
-    next: ctypes.c_void_p; prev: ctypes.c_void_p; prop: ctypes.c_void_p
-    identifier: ctypes.c_char*64; name: ctypes.c_char*64; storage: ctypes.c_void_p
-    in_out: ctypes.c_short; typeinfo: ctypes.c_void_p; idname: ctypes.c_char*64
-    default_value: ctypes.c_void_p; _pad: ctypes.c_char*4; label: ctypes.c_char*64
-    description: ctypes.c_char*64; short_label: ctypes.c_char*64
-    default_attribute_name: ctypes.POINTER(ctypes.c_char); to_index: ctypes.c_int
-    link: ctypes.c_void_p; ns: BNodeStack; runtime: ctypes.POINTER(BNodeSocketRuntimeHandle)
-StructBase._init_structs()
-
-def rounded_rect(l,b,r,t,rad,seg=8):
-    v=[]
-    for i in range(seg+1): a=-pi/2+(i/seg)*(pi/2);v.append((r-rad+cos(a)*rad,b+rad+sin(a)*rad))
-    for i in range(seg+1): a=(i/seg)*(pi/2);v.append((r-rad+cos(a)*rad,t-rad+sin(a)*rad))
-    for i in range(seg+1): a=pi/2+(i/seg)*(pi/2);v.append((l+rad+cos(a)*rad,t-rad+sin(a)*rad))
-    for i in range(seg+1): a=pi+(i/seg)*(pi/2);v.append((l+rad+cos(a)*rad,b+rad+sin(a)*rad))
-    v.append(v[0]);return v
-
-def get_node_bounds_px(node,v2d,ui):
-    ax, ay = node.location.x, node.location.y; p = node.parent
-    while p: ax += p.location.x; ay += p.location.y; p = p.parent
-    min_x = ax * ui; max_x = min_x + node.dimensions.x; max_y = ay * ui; min_y = max_y - node.dimensions.y
-    x1, y1 = v2d.view_to_region(min_x, min_y, clip=False); x2, y2 = v2d.view_to_region(max_x, max_y, clip=False)
-    l, r = sorted((x1, x2)); b, t = sorted((y1, y2))
-    if node.hide: offset = -6 * ui; t -= offset; b -= offset
-    return l, b, r, t
-
-def get_socket_pos_px(self, socket, v2d):
-    ptr = socket.as_pointer()
-    if ptr in self._sock_cache: return self._sock_cache[ptr]
-    pos = None
-    try:
-        if socket.enabled:
-            s = BNodeSocket.from_address(ptr)
-            if s.runtime:
-                loc = s.runtime.contents.location
-                pos = v2d.view_to_region(loc[0], loc[1], clip=False)
-    except: pass
-    self._sock_cache[ptr] = pos
-    return pos
-
-def bezier_verts_from_link(link, v2d, ui_scale):
-    fs, ts = link.from_socket, link.to_socket
-    try:
-        if not (fs.enabled and ts.enabled): return None
-        s_from = BNodeSocket.from_address(fs.as_pointer())
-        s_to = BNodeSocket.from_address(ts.as_pointer())
-        if not (s_from.runtime and s_to.runtime): return None
-        loc_from, loc_to = s_from.runtime.contents.location, s_to.runtime.contents.location
-        x1_view, y1_view, x2_view, y2_view = loc_from[0], loc_from[1], loc_to[0], loc_to[1]
-    except: return None
-    dx_view = x2_view - x1_view; dy_view = y2_view - y1_view
-    try: curveness = bpy.context.preferences.themes[0].node_editor.noodle_curving / 10.0
-    except: curveness = 0.5
-    handle_dist_view = dx_view * curveness if dx_view >= 0 else sqrt(dx_view**2 + dy_view**2) * curveness
-    p0, p1 = (x1_view, y1_view), (x1_view + handle_dist_view, y1_view)
-    p2, p3 = (x2_view - handle_dist_view, y2_view), (x2_view, y2_view)
-    approx_len = abs(dx_view) + abs(dy_view)
-    segs = max(8, min(64, int(approx_len / 15)))
-    view_verts = [None] * (segs + 1)
-    for i in range(segs + 1):
-        t = i / float(segs); inv_t = 1.0 - t
-        a=inv_t**3; b=3*inv_t**2*t; c=3*inv_t*t**2; d=t**3
-        x = a*p0[0] + b*p1[0] + c*p2[0] + d*p3[0]
-        y = a*p0[1] + b*p1[1] + c*p2[1] + d*p3[1]
-        view_verts[i] = (x, y)
-    v2r = v2d.view_to_region
-    return [v2r(p[0], p[1], clip=False) for p in view_verts]
-
-def collect_full_path_info(start_socket):
-    links, targets = set(), set()
-    if not start_socket: return links, targets, None
-    current_socket, visited_sockets = start_socket, {start_socket}
+def overview_curves(tree, color_mode, curving):
+    """Control points and colors for every visible link of ``tree``."""
+    graph = get_tree_graph(tree); n = len(graph.links)
+    if not n: return np.empty((0, 4, 2)), np.empty((0, 4), np.float32)
+    ptrs = np.frombuffer(graph.ptrs, dtype=np.uint64)
+    lf, lt = np.frombuffer(graph.link_from, dtype=np.int32), np.frombuffer(graph.link_to, dtype=np.int32)
+    locs, valid = read_socket_locations(np.stack((ptrs[lf], ptrs[lt]), axis=1).ravel(), tree)
+    ok = valid.reshape(-1, 2).all(axis=1) & ~np.frombuffer(graph.link_hidden(), dtype=bool)
+    values = np.asarray(graph.link_fanout() if color_mode == 'FANOUT' else graph.link_depth())[ok]
+    return link_control_points(locs.reshape(-1, 4)[ok], curving), ramp_colors(values)
+
+_graph_jobs = {}   # tree pointer -> iter_tree_graph job
+
+def ready_graph(tree):
+    """Current graph of ``tree`` for draw handlers, or None while a timer still builds it in HOVER_BUDGET slices."""
+    if (g := peek_tree_graph(tree)) is not None: return g
+    if (p := tree.as_pointer()) not in _graph_jobs:
+        _graph_jobs[p] = iter_tree_graph(tree)
+        if not bpy.app.timers.is_registered(_graph_tick): bpy.app.timers.register(_graph_tick)
+    return None
+
+def _graph_tick():
+    deadline, done = time.perf_counter() + HOVER_BUDGET, False
+    for p, job in list(_graph_jobs.items()):
+        try:
+            while time.perf_counter() < deadline: next(job)
+        except (StopIteration, ReferenceError): del _graph_jobs[p]; done = True
+    if done: _redraw_node_editors()
+    return 1.0 / 60.0 if _graph_jobs else None
+
+def clear_graph_jobs():
+    _graph_jobs.clear()
+    if bpy.app.timers.is_registered(_graph_tick): bpy.app.timers.unregister(_graph_tick)
+
+def draw_overview(self, tree, v2d, ui, bounds):
+    if (g := ready_graph(tree)) is None: return
+    affine, curving = view_affine(v2d), _theme_curving()
+    # Drags send no tree update; the move count re-reads socket locations after one.
+    key = (g.key, tree.as_pointer(), self.overview_color, curving, self._moves)
+    if self._overview_key != key:
+        self._overview_curves = overview_curves(tree, self.overview_color, curving)
+        self._overview_key, self._overview = key, None
+    ctrl, colors = self._overview_curves
+    if not len(ctrl): return
+    gpu.state.blend_set("ALPHA")
+    if overview_shader():
+        if self._overview is None: self._overview = LinkOverview(ctrl, colors, key)
+        self._overview.draw(affine, line_thickness * ui)
+    else:
+        # No custom shaders on this backend: tessellate on the CPU into the regular highlight batch.
+        if self._overview is None or self._overview[0] != (affine, bounds):
+            vis = bezier_visible(ctrl, affine, bounds, line_thickness * ui)
+            curves = tessellate_links(ctrl[vis], lod_segments(ctrl[vis], affine[0]), affine)
+            self._overview = ((affine, bounds), build_highlight_batch(self._shader, [], [], curves, ui, curve_colors=colors[vis]))
+        if bpy.app.version >= (5, 0, 0): gpu.state.line_width_set(line_thickness * ui)
+        if self._overview[1]: self._overview[1].draw(self._shader)
+    gpu.state.blend_set("NONE")
+
+DEAD_COLOR = (1.0, 0.25, 0.55, 0.9)
+DEAD_SOCKET_PX = 5.0
+
+def view_to_region_rects(view, hidden, affine, ui):
+    sx, sy, ox, oy = affine
+    x = view[:, 0::2] * sx + ox; y = view[:, 1::2] * sy + oy
+    rects = np.stack((x.min(axis=1), y.min(axis=1), x.max(axis=1), y.max(axis=1)), axis=1)
+    rects[hidden, 1::2] += 6 * ui
+    return rects
+
+def draw_dead(self, tree, v2d, ui, bounds):
+    """Outline nodes that reach no output node and mark outputs that lead nowhere."""
+    if (g := ready_graph(tree)) is None: return
+    nodes, ptrs = find_dead_nodes(tree); key = (g.key, ui, self._moves)
+    if self._dead_key != key:
+        self._dead_view = np.array([node_view_bounds(nd, ui) for nd in nodes], dtype=np.float64).reshape(-1, 4)
+        self._dead_hidden = np.array([nd.hide for nd in nodes], dtype=bool); self._dead_key = key
+    affine = view_affine(v2d)
+    if self._dead_batch_key != (key, affine, bounds):
+        rects = view_to_region_rects(self._dead_view, self._dead_hidden, affine, ui)
+        locs, valid = read_socket_locations(np.array(ptrs, dtype=np.uint64), tree)
+        pts = locs[valid] * affine[:2] + affine[2:]; r = DEAD_SOCKET_PX * ui
+        rects = np.concatenate((rects, np.hstack((pts - r, pts + r))))
+        vis = rects_visible(rects, bounds, 5.0 * ui)
+        colors = np.tile(np.array(DEAD_COLOR, dtype=np.float32), (int(vis.sum()), 1))
+        self._dead_batch, self._dead_batch_key = build_highlight_batch(self._shader, rects[vis], colors, [], ui), (key, affine, bounds)
+    if self._dead_batch: submit_batch(self._dead_batch, self._shader, ui)
+
+HOVER_RADIUS = 20.0
+HOVER_MARGIN = 30.0
+CONE_FADE = 0.8
+CONE_MIN_ALPHA = 0.15
+HOVER_BUDGET = 0.002
+HIGHLIGHT_CHUNK = 256
+
+def _merged(name):
+    """Array attribute kept as a list of chunks and concatenated on first read."""
+    def get(self):
+        if len(parts := self._parts[name]) > 1: parts[:] = [np.concatenate(parts)]
+        return parts[0]
+    def put(self, value): self._parts[name] = [value]
+    return property(get, put)
+
+class HighlightSet:
+    """Nodes and links drawn for one hovered socket, resolved once per tree state.
+
+    Links are kept as socket pointer pairs and nodes as view-space bounds, so redraws
+    after pan or zoom need no RNA access. The ``live`` nodes (the chain itself) are
+    re-read when they move. Sets grow through ``add``; ``version`` counts the additions.
+    Link control points stay in view space too and are re-read only when nodes move.
+    Link colors are per link, so any coloring still draws as one batch. Chunks are
+    collected and joined once when read, so growing a set stays linear.
+    """
+    __slots__ = ("nodes", "live", "sig", "version", "_parts", "_curves")
+    node_view, node_hidden, node_colors, link_ptrs, link_colors = map(_merged, ("node_view", "node_hidden", "node_colors", "link_ptrs", "link_colors"))
+
+    def __init__(self):
+        self.nodes, self.live, self.sig, self.version, self._curves = [], [], [], 0, None
+        self._parts = {"node_view": [np.empty((0, 4))], "node_hidden": [np.empty(0, dtype=bool)],
+                       "node_colors": [np.empty((0, 4), dtype=np.float32)],
+                       "link_ptrs": [np.empty((0, 2), dtype=np.uint64)], "link_colors": [np.empty((0, 4), dtype=np.float32)]}
+
+    def add(self, graph, link_alpha, node_alpha, ui, live=False, colored=False):
+        """Append links and nodes (graph ids -> alpha); ``live`` marks them as chain nodes.
+
+        Links are white, or with ``colored`` take the socket color of their chain's source.
+        """
+        hidden, ptrs, lf, lt = graph.link_hidden(), graph.ptrs, graph.link_from, graph.link_to
+        lids = [l for l in link_alpha if not hidden[l]]
+        lcol = np.ones((len(lids), 4), dtype=np.float32)
+        if colored and lids:
+            srcs = [graph.source(lf[l]) for l in lids]; rgb = {s: socket_color(graph.sockets[s]) for s in set(srcs)}
+            lcol[:] = [rgb[s] for s in srcs]
+        lcol[:, 3] = [link_alpha[l] for l in lids]
+        parts = self._parts
+        parts["link_ptrs"].append(np.array([(ptrs[lf[l]], ptrs[lt[l]]) for l in lids], dtype=np.uint64).reshape(-1, 2))
+        parts["link_colors"].append(lcol)
+        nodes = [graph.nodes[n] for n in node_alpha]
+        ncol = np.array([get_node_border_color(nd) for nd in nodes], dtype=np.float32).reshape(-1, 4)
+        ncol[:, 3] *= np.fromiter(node_alpha.values(), dtype=np.float32, count=len(node_alpha))
+        self.nodes += nodes; parts["node_colors"].append(ncol)
+        parts["node_view"].append(np.array([node_view_bounds(nd, ui) for nd in nodes], dtype=np.float64).reshape(-1, 4))
+        parts["node_hidden"].append(np.array([nd.hide for nd in nodes], dtype=bool))
+        if live: self.live += nodes; self.sig += [tuple(nd.location) for nd in nodes]
+        self.version += 1
+
+    def signature(self):
+        return [tuple(nd.location) for nd in self.live]
+
+    def refresh(self, ui, sig=None):
+        self.sig = sig if sig is not None else self.signature()
+        self.node_view = np.array([node_view_bounds(nd, ui) for nd in self.nodes], dtype=np.float64).reshape(-1, 4)
+        self.node_hidden = np.array([nd.hide for nd in self.nodes], dtype=bool)
+
+    def curves(self, tree, curving, key):
+        """(control points, link rows) of the set's links; ``key`` changes when nodes move."""
+        key = (self.version, curving, key)
+        if self._curves is None or self._curves[0] != key: self._curves = (key, *link_curves(tree, self.link_ptrs, curving))
+        return self._curves[1:]
+
+    def region_rects(self, affine, ui):
+        return view_to_region_rects(self.node_view, self.node_hidden, affine, ui)
+
+def iter_highlight(socket, ui, cone='NONE', limit=0, colored=False):
+    """Build the HighlightSet for the chain through ``socket`` step by step.
+
+    Yields None while the graph or cone is being walked and the growing set after each
+    chunk of nodes is added (chain first, then the dependency cone faded by hop depth).
+    Returns the finished set, or None when the socket has no chain.
+    """
+    g = yield from iter_tree_graph(socket.id_data)
+    if (s := g.sid.get(socket.as_pointer())) is None: return None
+    fl, targets, src = yield from g.iter_chain(s, through_groups=True)
+    if not fl: return None
+    yield from g.iter_link_hidden()
+    hl = HighlightSet(); links = dict.fromkeys(fl, 1.0)
+    nodes = dict.fromkeys((n for n in chain(targets, (g.sock_node[src],)) if not g.reroute[n]), 1.0)
+    yield from _add_chunked(hl, g, links.items(), nodes.items(), ui, True, colored)
+    if cone != 'NONE':
+        cn, cl = yield from g.iter_dependency_cone(s, cone in {'UPSTREAM', 'BOTH'}, cone in {'DOWNSTREAM', 'BOTH'}, limit)
+        # Lazy, so fading a large cone is spread over the chunks too.
+        cl = ((l, max(CONE_MIN_ALPHA, CONE_FADE ** d)) for l, d in cl.items() if l not in links)
+        cn = ((n, max(CONE_MIN_ALPHA, CONE_FADE ** d)) for n, d in cn.items() if n not in nodes and not g.reroute[n])
+        yield from _add_chunked(hl, g, cl, cn, ui, False, colored)
+    return hl
+
+def _add_chunked(hl, graph, links, nodes, ui, live=False, colored=False):
+    """Add (graph id, alpha) pairs to ``hl`` HIGHLIGHT_CHUNK at a time, yielding the set after each chunk."""
+    links, nodes = iter(links), iter(nodes)
     while True:
-        if not current_socket.is_output:
-            if current_socket.is_linked: current_socket = current_socket.links[0].from_socket
-            else: break
-        if current_socket.node.bl_idname == 'NodeReroute':
-            reroute_input = current_socket.node.inputs[0]
-            if reroute_input.is_linked:
-                next_socket = reroute_input.links[0].from_socket
-                if next_socket in visited_sockets: break
-                visited_sockets.add(next_socket); current_socket = next_socket
-            else: break
-        else: break
-    ultimate_source_socket, ultimate_source_node = current_socket, current_socket.node
-    q, visited_downstream = deque([ultimate_source_socket]), set()
-    while q:
-        s = q.popleft()
-        if s in visited_downstream: continue
-        visited_downstream.add(s)
-        for lk in s.links:
-            links.add(lk); ts = lk.to_socket
-            if ts.node.bl_idname == 'NodeReroute':
-                if ts.node.outputs: q.append(ts.node.outputs[0])
-            else: targets.add(ts.node)
-    return links, targets, ultimate_source_node
-
-def find_ultimate_source(input_socket):
-    if not input_socket.is_linked: return None, None
-    from_socket = input_socket.links[0].from_socket; visited = {from_socket}
-    while from_socket.node.bl_idname == 'NodeReroute':
-        if not from_socket.node.inputs[0].is_linked: break
-        next_socket = from_socket.node.inputs[0].links[0].from_socket
-        if next_socket in visited: return None, None
-        from_socket = next_socket; visited.add(from_socket)
-    return from_socket, from_socket.node
-
-def find_ultimate_targets(output_socket):
-    targets = []; q, visited = deque([output_socket]), set()
-    while q:
-        s = q.popleft()
-        if s in visited: continue
-        visited.add(s)
-        for link in s.links:
-            to_socket = link.to_socket
-            if to_socket.node.bl_idname == 'NodeReroute':
-                if to_socket.node.outputs: q.append(to_socket.node.outputs[0])
-            else: targets.append(to_socket)
-    return targets
+        lk, nd = dict(islice(links, HIGHLIGHT_CHUNK)), dict(islice(nodes, HIGHLIGHT_CHUNK))
+        if not (lk or nd): return
+        hl.add(graph, lk, nd, ui, live, colored)
+        yield hl
+
+def _tree_key(tree, ui):
+    # Edits reach tree_version through the depsgraph handler; the counts also catch
+    # node groups edited while no depsgraph update is sent for them.
+    return tree.as_pointer(), tree_version(tree), len(tree.nodes), ui, len(tree.links)
+
+def _draw_callback(self, context):
+    # Looked up on every call so profiling can wrap and unwrap draw_callback_px under a running highlighter.
+    draw_callback_px(self, context)
 
 def draw_callback_px(self, context):
     if not self.active: return
     area=self.active_area; region=context.region
     if not area or context.area!=area or not region or region.type!='WINDOW': return
-    self._sock_cache.clear()
     v2d=region.view2d; ui=context.preferences.system.ui_scale
     if not (tree := getattr(context.space_data,"edit_tree",None)): return
-    md, bs = (20.0 * ui)**2, None
-    mx, my = self.mouse_pos
-    margin = 30.0 * ui
-    candidate_sockets = []
-    for node in tree.nodes:
-        l, b, r, t = get_node_bounds_px(node, v2d, ui)
-        if mx >= l - margin and mx <= r + margin and my >= b - margin and my <= t + margin:
-             candidate_sockets.extend(s for s in chain(node.inputs, node.outputs) if s.is_linked)
-    for s in candidate_sockets:
-        if (p := get_socket_pos_px(self, s, v2d)):
-            d = (p[0] - mx)**2 + (p[1] - my)**2
-            if d < md: md, bs = d, s
-    self.start_socket = bs
-    if not bs: self.links_chain.clear(); self.chain_targets.clear(); return
-    self.links_chain, self.chain_targets, ultimate_source_node = collect_full_path_info(bs)
-    if not self.links_chain: return
-    sh = self._shader
-    gpu.state.blend_set("ALPHA"); sh.bind()
-    nodes_to_draw = list(self.chain_targets)
-    if ultimate_source_node: nodes_to_draw.append(ultimate_source_node)
-    if nodes_to_draw:
-        for nd in nodes_to_draw:
-            if nd and nd.bl_idname != 'NodeReroute':
-                l,b,r,t = get_node_bounds_px(nd, v2d, ui)
-                col = get_node_border_color(nd, self._color_cache)
-                verts = rounded_rect(l, b, r, t, 10)
-                sh.uniform_float("color", col)
-                if bpy.app.version < (5, 0, 0):
-                    strip = _tri_strip_polygon(verts, 5.0 * ui)
-                    if strip:
-                        batch_for_shader(sh, 'TRI_STRIP', {"pos": strip}).draw(sh)
-                else:
-                    gpu.state.line_width_set(max(1, 2 * ui))
-                    batch_for_shader(sh, 'LINE_STRIP', {"pos": verts}).draw(sh)
-    sh.uniform_float("color", (1, 1, 1, 1))
-    for lk in self.links_chain:
-        if (verts := bezier_verts_from_link(lk, v2d, ui)):
-            if bpy.app.version < (5, 0, 0):
-                strip = _tri_strip_polyline(verts, max(3.0, line_thickness * ui))
-                if strip:
-                    batch_for_shader(sh, 'TRI_STRIP', {"pos": strip}).draw(sh)
-            else:
-                gpu.state.line_width_set(line_thickness * ui)
-                batch_for_shader(sh, 'LINE_STRIP', {"pos": verts}).draw(sh)
+    # The modal handler owns hit-testing; only catch up here if the tree changed under a still cursor.
+    if self._hover_key != _tree_key(tree, ui): self.update_hover(context)
+    else: self.follow_nodes(context, tree, ui, self._hover_key)
+    self._sync_timer(context)
+    bounds = (0, 0, region.width, region.height)
+    if self.mode == 'OVERVIEW': draw_overview(self, tree, v2d, ui, bounds)
+    elif self.mode == 'DEAD': draw_dead(self, tree, v2d, ui, bounds)
+    if not (hl := self.highlight): return
+    affine = view_affine(v2d)
+    # Chain node locations are part of the key so borders follow nodes dragged while highlighted.
+    if (sig := hl.signature()) != hl.sig: hl.refresh(ui, sig)
+    key = (self._hover_key, self.start_socket.as_pointer(), id(hl), hl.version, affine, bounds, hl.sig, self._moves)
+    if key != self._batch_key:
+        pad = 5.0 * ui
+        rects = hl.region_rects(affine, ui); vis = rects_visible(rects, bounds, pad)
+        curves, kept = bezier_verts_from_links(*hl.curves(tree, _theme_curving(), (hl.sig, self._moves)), affine, bounds, pad)
+        lcol = hl.link_colors[kept]
+        if self.distance_tint and curves:
+            loc, ok = read_socket_locations([self.start_socket.as_pointer()], tree, [self.start_socket])
+            if ok[0]: lcol = tint_by_distance(curves, lcol, loc[0] * affine[:2] + affine[2:])
+        batch = build_highlight_batch(self._shader, rects[vis], hl.node_colors[vis], curves, ui, curve_colors=lcol)
+        self._batch, self._batch_key = batch, key
+    if self._batch: submit_batch(self._batch, self._shader, ui)
+
+DISTANCE_TINT = 0.7
+
+def tint_by_distance(curves, colors, origin):
+    """Darken each curve's color by how far its midpoint lies from ``origin``, relative to the farthest curve."""
+    mid = np.array([c[len(c) // 2] for c in curves], dtype=np.float32)
+    d = np.hypot(*(mid - np.asarray(origin, dtype=np.float32)).T)
+    out = np.array(colors, dtype=np.float32); out[:, :3] *= (1.0 - DISTANCE_TINT * d / max(float(d.max()), 1e-6))[:, None]
+    return out
+
+def submit_batch(batch, sh, ui):
+    gpu.state.blend_set("ALPHA")
+    if bpy.app.version >= (5, 0, 0): gpu.state.line_width_set(line_thickness * ui)
+    batch.draw(sh)
     gpu.state.blend_set("NONE")
 
+def build_highlight_batch(sh, rects, colors, curves, ui, curve_colors=None):
+    """Merge node borders (rects with one color each) and link curves into one per-vertex-color batch.
+
+    Curves are white unless ``curve_colors`` gives one color per curve.
+
+    Blender 4.x ignores line_width_set on some backends, so outlines are stroked into
+    triangles there; 5.0+ draws plain line segments.
+    """
+    borders, order = rounded_rects_lod(rects, 10) if len(rects) else ([], None)
+    if bpy.app.version < (5, 0, 0):
+        bv, bo = stroke_polylines(borders, 5.0 * ui, closed=True)
+        lv, lo = stroke_polylines(curves, max(3.0, line_thickness * ui))
+    else:
+        bv, bo = line_segments(borders, closed=True); lv, lo = line_segments(curves)
+    if not (len(bv) or len(lv)): return None
+    col = np.empty((len(bv) + len(lv), 4), dtype=np.float32)
+    if len(bv): col[:len(bv)] = np.asarray(colors, dtype=np.float32)[order[bo]]
+    col[len(bv):] = 1.0 if curve_colors is None else np.asarray(curve_colors, dtype=np.float32)[lo]
+    return batch_for_shader(sh, 'TRIS' if bpy.app.version < (5, 0, 0) else 'LINES', {"pos": np.concatenate((bv, lv)), "color": col})
+
+
+PIN_LINK_COLOR = (1.0, 0.75, 0.3, 0.95)
+_pins = {}           # tree pointer -> PinnedTree
+_pin_draw = None
+
+def _link_pairs(g):
+    ptrs = np.frombuffer(g.ptrs, dtype=np.uint64)
+    lf, lt = np.frombuffer(g.link_from, dtype=np.int32), np.frombuffer(g.link_to, dtype=np.int32)
+    return zip(ptrs[lf].tolist(), ptrs[lt].tolist())
+
+class PinnedTree:
+    """Chains pinned in one tree, drawn in every editor area that shows the tree.
+
+    Pins are keyed by the pointer of their chain's source socket and store their links as
+    socket pointer pairs, so they outlive graph rebuilds. On a tree change only pins whose
+    sockets an added or removed link touches are walked again. The union of all pins is one
+    HighlightSet, and each area caches one batch for it.
+
+    Each pin also keeps its source as (node name, is output, socket identifier) and the tree
+    its ``owner`` key, so after load, undo or redo the pins come back as ``pending`` addresses
+    that the next sync resolves by name.
+    """
+    __slots__ = ("owner", "pins", "pending", "graph", "pairs", "hl", "ui", "version", "batches")
+
+    def __init__(self, owner=None, pending=()):
+        self.owner, self.pins, self.pending = owner, {}, list(pending)
+        self.graph, self.pairs, self.hl, self.ui, self.version, self.batches = None, frozenset(), None, None, 0, {}
+
+    @staticmethod
+    def _walk(g, s):
+        """(source pointer, (link pairs, node pointers, socket pointers, address)) of the chain through socket ``s``."""
+        fl, targets, src = g.chain(s, through_groups=True)
+        if not fl: return None
+        ptrs, lf, lt = g.ptrs, g.link_from, g.link_to
+        pairs = frozenset((ptrs[lf[l]], ptrs[lt[l]]) for l in fl)
+        nodes = frozenset(g.nodes[n].as_pointer() for n in chain(targets, (g.sock_node[src],)) if not g.reroute[n])
+        address = (g.nodes[g.sock_node[src]].name, bool(g.is_out[src]), g.socket_ident(src))
+        return ptrs[src], (pairs, nodes, frozenset(chain.from_iterable(pairs)), address)
+
+    def sync(self, g, tree):
+        """Move to graph ``g`` of ``tree``; pins touched by links added or removed since the last sync are walked again."""
+        if g is self.graph: return g
+        pairs = frozenset(_link_pairs(g)); touched = set(chain.from_iterable(pairs ^ self.pairs))
+        for src, pin in list(self.pins.items()):
+            if touched.isdisjoint(pin[2]) and src in g.sid: continue
+            del self.pins[src]
+            if (s := g.sid.get(src)) is not None and (res := self._walk(g, s)): self.pins[res[0]] = res[1]
+        for name, out, ident in self.pending:
+            if not (nd := tree.nodes.get(name)): continue
+            sock = next((x for x in (nd.outputs if out else nd.inputs) if x.identifier == ident), None)
+            if sock is not None and (s := g.sid.get(sock.as_pointer())) is not None and (res := self._walk(g, s)): self.pins[res[0]] = res[1]
+        self.graph, self.pairs, self.hl, self.pending = g, pairs, None, []
+        return g
+
+    def toggle(self, socket):
+        """Pin the chain through ``socket``, or unpin it when already pinned; True when now pinned."""
+        g = self.sync(get_tree_graph(socket.id_data), socket.id_data)
+        if (s := g.sid.get(socket.as_pointer())) is None or not (res := self._walk(g, s)): return False
+        src, pin = res; self.hl = None
+        if self.pins.pop(src, None) is None: self.pins[src] = pin; return True
+        return False
+
+    def highlight(self, g, tree, ui):
+        self.sync(g, tree)
+        if self.hl is None or self.ui != ui:
+            ids = {p: l for l, p in enumerate(_link_pairs(g))}; nidx = g.node_index(); links, nodes = {}, {}
+            for pairs, nds, *_ in self.pins.values():
+                links.update((ids[p], 1.0) for p in pairs if p in ids); nodes.update((nidx[p], 1.0) for p in nds if p in nidx)
+            hl = HighlightSet(); hl.add(g, links, nodes, ui, live=True); hl.link_colors[:] = PIN_LINK_COLOR
+            self.hl, self.ui = hl, ui; self.version += 1; self.batches.clear()
+        return self.hl
+
+def _draw_pins():
+    context = bpy.context; region = context.region
+    if not region or region.type != 'WINDOW' or not (tree := getattr(context.space_data, "edit_tree", None)): return
+    if not (pt := _pins.get(tree.as_pointer())) or not (pt.pins or pt.pending): return
+    ui = context.preferences.system.ui_scale
+    if (g := ready_graph(tree)) is None: return
+    try: hl = pt.highlight(g, tree, ui)
+    except ReferenceError: return
+    if (sig := hl.signature()) != hl.sig: hl.refresh(ui, sig)
+    affine = view_affine(region.view2d); bounds = (0, 0, region.width, region.height)
+    key = (pt.version, affine, bounds, hl.sig); sh = gpu.shader.from_builtin('FLAT_COLOR')
+    if (cached := pt.batches.get(area := context.area.as_pointer())) is None or cached[0] != key:
+        pad = 5.0 * ui; rects = hl.region_rects(affine, ui); vis = rects_visible(rects, bounds, pad)
+        curves, kept = bezier_verts_from_links(*hl.curves(tree, _theme_curving(), hl.sig), affine, bounds, pad)
+        cached = pt.batches[area] = (key, build_highlight_batch(sh, rects[vis], hl.node_colors[vis], curves, ui, curve_colors=hl.link_colors[kept]))
+    if cached[1]: submit_batch(cached[1], sh, ui)
+
+def _redraw_node_editors():
+    for win in bpy.context.window_manager.windows:
+        for area in win.screen.areas:
+            if area.type == 'NODE_EDITOR': area.tag_redraw()
+
+def _sync_pin_draw():
+    global _pin_draw
+    if _pins and _pin_draw is None: _pin_draw = bpy.types.SpaceNodeEditor.draw_handler_add(_draw_pins, (), 'WINDOW', 'POST_PIXEL')
+    elif not _pins and _pin_draw is not None: bpy.types.SpaceNodeEditor.draw_handler_remove(_pin_draw, 'WINDOW'); _pin_draw = None
+
+def toggle_pin(socket):
+    """Pin or unpin the chain through ``socket`` in every editor showing its tree; True when now pinned."""
+    p = socket.id_data.as_pointer()
+    if (pt := _pins.get(p)) is None: pt = _pins[p] = PinnedTree(tree_owner(socket.id_data))
+    pinned = pt.toggle(socket)
+    if not pt.pins: del _pins[p]
+    _sync_pin_draw(); _redraw_node_editors()
+    return pinned
+
+def clear_pins(tree=None):
+    """Unpin every chain of ``tree``, or of all trees."""
+    if tree is None: _pins.clear()
+    else: _pins.pop(tree.as_pointer(), None)
+    _sync_pin_draw()
+    if bpy.context.window_manager: _redraw_node_editors()
+
+def restore_pins():
+    """Re-resolve every pin by name; tree and socket pointers may name other data after load, undo or redo."""
+    old = list(_pins.values()); _pins.clear()
+    for pt in old:
+        if pt.owner is None or (tree := owner_tree(pt.owner)) is None: continue
+        pending = [pin[3] for pin in pt.pins.values()] + pt.pending
+        if pending: _pins[tree.as_pointer()] = PinnedTree(pt.owner, pending)
+    _sync_pin_draw()
+    if bpy.context.window_manager: _redraw_node_editors()
+
+@bpy.app.handlers.persistent
+def _on_reset(*args):
+    # Loading a file also drops the build timer, so jobs left in flight would never finish.
+    restore_pins(); clear_graph_jobs()
 
+def register():
+    for h in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post): h.append(_on_reset)
+
+def unregister():
+    for h in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post):
+        if _on_reset in h: h.remove(_on_reset)
+    clear_pins()
+
+
+# Pie entries are (levels, group path, socket): leave ``levels`` groups of the editor
+# path, then enter the group nodes in ``path`` to reach ``socket.node``.
+PIE_PAGE_SIZE = 12
+PIE_REGISTRY_SIZE = 8
+
+def _parent_group(space, levels):
+    """(parent tree, group node) ``levels`` steps up the editor path."""
+    path = space.path
+    if len(path) <= levels: return None, None
+    parent, inner = path[len(path) - 1 - levels].node_tree, path[len(path) - levels].node_tree
+    if (act := parent.nodes.active) and getattr(act, "node_tree", None) == inner: return parent, act
+    return parent, next((n for n in parent.nodes if getattr(n, "node_tree", None) == inner), None)
+
+def _outer_sources(space, levels, ident):
+    parent, gnode = _parent_group(space, levels)
+    if gnode is None or not (sock := next((s for s in gnode.inputs if s.identifier == ident), None)): return []
+    g = get_tree_graph(parent)
+    if (s := g.sid.get(sock.as_pointer())) is None or not (res := g.deep_source(s)): return []
+    path, src, entry = res
+    return [(levels, path, src)] if src is not None else _outer_sources(space, levels + 1, entry)
+
+def _outer_targets(space, levels, ident):
+    parent, gnode = _parent_group(space, levels)
+    if gnode is None or not (sock := next((s for s in gnode.outputs if s.identifier == ident), None)): return []
+    g = get_tree_graph(parent)
+    if (s := g.sid.get(sock.as_pointer())) is None: return []
+    targets, exits = g.deep_targets(s)
+    out = [(levels, path, t) for path, t in targets]
+    for e in exits: out.extend(_outer_targets(space, levels + 1, e))
+    return out
+
+def pie_entries(space, node):
+    """Sources feeding ``node`` and targets it feeds, resolved through node groups in both directions."""
+    g = get_tree_graph(space.edit_tree); ups, downs = [], []
+    for s_in in node.inputs:
+        if (s := g.sid.get(s_in.as_pointer())) is None or not (res := g.deep_source(s)): continue
+        path, src, entry = res
+        if src is not None: ups.append((0, path, src))
+        else: ups.extend(_outer_sources(space, 1, entry))
+    for s_out in node.outputs:
+        if (s := g.sid.get(s_out.as_pointer())) is None: continue
+        targets, exits = g.deep_targets(s)
+        downs.extend((0, path, t) for path, t in targets)
+        for e in exits: downs.extend(_outer_targets(space, 1, e))
+    if node.bl_idname == 'NodeGroupInput':
+        for s_out in node.outputs:
+            if s_out.is_linked: ups.extend(_outer_sources(space, 1, s_out.identifier))
+    elif node.bl_idname == 'NodeGroupOutput':
+        for s_in in node.inputs:
+            if s_in.is_linked: downs.extend(_outer_targets(space, 1, s_in.identifier))
+    return ups, downs
+
+def _space_key(space):
+    return (tuple(p.node_tree.as_pointer() for p in space.path), tree_version(space.edit_tree),
+            len(space.edit_tree.nodes), len(space.edit_tree.links))
+
+def _section(space, node, levels, path, upstream):
+    """(label, anchor node) of the tree an entry lives in; distances in it are measured from the anchor."""
+    if path:
+        io = 'NodeGroupOutput' if upstream else 'NodeGroupInput'
+        return "../" * levels + "".join(f"{gn.label or gn.name}/" for gn in path), next((n for n in path[-1].node_tree.nodes if n.bl_idname == io), None)
+    if levels: return "../" * levels, _parent_group(space, levels)[1]
+    return "", node
+
+class PieEntries:
+    """Sources and targets of one clicked node, grouped by tree and sorted by distance.
+
+    ``sides`` maps 'UP'/'DOWN' to flat lists of (section label, levels, group path, socket),
+    ordered by section, then by view distance from the section's anchor node. Entries
+    hold the sockets themselves, so drawing and jumping never look nodes up by name.
+    """
+    __slots__ = ("key", "sides", "page", "group")
+
+    def __init__(self, space, node, key):
+        self.key = key; self.page = {'UP': 0, 'DOWN': 0}; self.sides = {}
+        self.group = node.node_tree if node.bl_idname in GROUP_IDNAMES else None
+        for side, entries in zip(('UP', 'DOWN'), pie_entries(space, node)):
+            seen, rows, anchors = set(), [], {}
+            for levels, path, sock in entries:
+                k = (levels, tuple(gn.as_pointer() for gn in path), sock.as_pointer())
+                if k in seen: continue
+                seen.add(k)
+                if (sec := anchors.get(k[:2])) is None: sec = anchors[k[:2]] = _section(space, node, levels, path, side == 'UP')
+                label, anchor = sec; loc = sock.node.location
+                d = (loc - anchor.location).length if anchor is not None else 0.0
+                rows.append(((levels, len(path), label, d), (label, levels, path, sock)))
+            rows.sort(key=lambda r: r[0]); self.sides[side] = [r[1] for r in rows]
+
+    def pages(self, side):
+        return max(1, -(-len(self.sides[side]) // PIE_PAGE_SIZE))
+
+    def visible(self, side):
+        """(index, entry) pairs on the current page of ``side``."""
+        start = self.page[side] * PIE_PAGE_SIZE
+        return list(enumerate(self.sides[side][start:start + PIE_PAGE_SIZE], start))
+
+_pie_registry = {}   # clicked socket pointer -> PieEntries
+_pie_current = None  # socket pointer the pie menu shows
+
+def open_pie_entries(space, socket):
+    """Make ``socket``'s entries the ones the pie menu shows, reusing them while the editor state holds."""
+    global _pie_current
+    p = socket.as_pointer(); key = _space_key(space)
+    if (e := _pie_registry.pop(p, None)) is None or e.key != key: e = PieEntries(space, socket.node, key)
+    _pie_registry[p] = e; _pie_current = p
+    while len(_pie_registry) > PIE_REGISTRY_SIZE: del _pie_registry[next(iter(_pie_registry))]
+    return e
+
+def current_pie_entries():
+    return _pie_registry.get(_pie_current)
+
+def clear_pie_entries():
+    global _pie_current
+    _pie_registry.clear(); _pie_current = None
+
+
+JUMP_FLASH_TIME = 1.2
+JUMP_FLASH_COLOR = (1.0, 0.85, 0.2)
+JUMP_FLASH_GROW = 12.0
+_flash = {}
+
+def _draw_jump_flash():
+    context = bpy.context; f = _flash
+    if not f or not context.area or context.area.as_pointer() != f["area"] or not context.region or context.region.type != 'WINDOW': return
+    if not (tree := getattr(context.space_data, "edit_tree", None)) or tree.as_pointer() != f["tree"]: return
+    if not (node := tree.nodes.get(f["node"])) or (t := (time.perf_counter() - f["start"]) / JUMP_FLASH_TIME) >= 1.0: return
+    ui = context.preferences.system.ui_scale
+    rects = view_to_region_rects(np.array([node_view_bounds(node, ui)]), np.array([node.hide]), view_affine(context.region.view2d), ui)
+    pad = (4.0 + JUMP_FLASH_GROW * t) * ui; rects[:, :2] -= pad; rects[:, 2:] += pad
+    sh = gpu.shader.from_builtin('FLAT_COLOR')
+    if (batch := build_highlight_batch(sh, rects, [(*JUMP_FLASH_COLOR, 1.0 - t)], [], ui)): submit_batch(batch, sh, ui)
+
+def _flash_tick():
+    if not _flash: return None
+    for win in bpy.context.window_manager.windows:
+        for area in win.screen.areas:
+            if area.as_pointer() == _flash["area"]: area.tag_redraw()
+    if time.perf_counter() - _flash["start"] < JUMP_FLASH_TIME: return 1.0 / 30.0
+    clear_jump_flash(); return None
+
+def flash_node(area, node):
+    """Draw a fading ring around ``node`` in ``area`` for JUMP_FLASH_TIME seconds; the tree is never touched."""
+    handle = _flash.get("handle") or bpy.types.SpaceNodeEditor.draw_handler_add(_draw_jump_flash, (), 'WINDOW', 'POST_PIXEL')
+    _flash.update(handle=handle, area=area.as_pointer(), tree=node.id_data.as_pointer(), node=node.name, start=time.perf_counter())
+    if not bpy.app.timers.is_registered(_flash_tick): bpy.app.timers.register(_flash_tick)
+
+def clear_jump_flash():
+    if (handle := _flash.get("handle")): bpy.types.SpaceNodeEditor.draw_handler_remove(handle, 'WINDOW')
+    _flash.clear()
+
+def center_view_on(window, area, node):
+    """Pan the editor so ``node`` sits in the middle of its main region, at the current zoom."""
+    if not (region := next((r for r in area.regions if r.type == 'WINDOW'), None)): return
+    l, b, r, t = node_view_bounds(node, bpy.context.preferences.system.ui_scale)
+    cx, cy = region.view2d.view_to_region((l + r) * 0.5, (b + t) * 0.5, clip=False)
+    with bpy.context.temp_override(window=window, area=area, region=region):
+        bpy.ops.view2d.pan(deltax=int(cx - region.width * 0.5), deltay=int(cy - region.height * 0.5))
+
+def jump_to(window, area, node, deferred=False):
+    """Center ``node`` and flash it. ``deferred`` waits for one redraw, as needed right after the editor switched trees."""
+    if not deferred: center_view_on(window, area, node); flash_node(area, node); return
+    tree, name = node.id_data, node.name
+    def _later():
+        try:
+            if (nd := tree.nodes.get(name)): center_view_on(window, area, nd); flash_node(area, nd)
+        except ReferenceError: pass
+        return None
+    area.tag_redraw(); bpy.app.timers.register(_later, first_interval=0.05)
 
 class CCC_OT_jump_to_node(bpy.types.Operator):
-    bl_idname="ccc.jump_to_node"; bl_label="Jump to Node"; bl_options={'REGISTER','UNDO'}
+    bl_idname="ccc.jump_to_node"; bl_label="Jump to Node"; bl_options={'REGISTER'}
     node_name:bpy.props.StringProperty()
+    side:bpy.props.EnumProperty(items=[('NONE',"Node Name",""),('UP',"Source",""),('DOWN',"Target","")],default='NONE')
+    index:bpy.props.IntProperty(min=0)
     def execute(self,context):
-        if context.area.type=='NODE_EDITOR' and (tree := context.space_data.edit_tree):
-            if (node := tree.nodes.get(self.node_name)):
-                bpy.ops.node.select_all(action='DESELECT'); node.select=True; tree.nodes.active=node
-                bpy.ops.node.view_selected('INVOKE_DEFAULT')
-                frame = tree.nodes.new("NodeFrame"); frame.label = "Jump Target"
-                frame.name = "TEMP_FRAME_FOR_HIGHLIGHT"; frame.location = (node.location.x-40, node.location.y-40)
-                frame.width = node.dimensions.x + 80; frame.height = node.dimensions.y + 80; node.parent = frame
-                def _remove_frame():
-                    if (f := tree.nodes.get("TEMP_FRAME_FOR_HIGHLIGHT")):
-                        for n in tree.nodes:
-                            if n.parent == f: n.parent = None
-                        tree.nodes.remove(f)
-                    return None
-                bpy.app.timers.register(_remove_frame, first_interval=1.0)
+        if context.area.type!='NODE_EDITOR' or not (space := context.space_data).edit_tree: return {'CANCELLED'}
+        start = space.edit_tree
+        if self.side == 'NONE':
+            if not (node := start.nodes.get(self.node_name)): return {'CANCELLED'}
+        else:
+            if not (pie := current_pie_entries()) or self.index >= len(entries := pie.sides[self.side]): return {'CANCELLED'}
+            _, levels, path, sock = entries[self.index]
+            try: node = sock.node; path = [(gn, gn.node_tree) for gn in path]
+            except ReferenceError: return {'CANCELLED'}
+            if any(inner is None for _, inner in path): return {'CANCELLED'}
+            for _ in range(min(levels, len(space.path) - 1)): space.path.pop()
+            for gn, inner in path: space.path.append(inner, node=gn)
+        jump_to(context.window, context.area, node, deferred=space.edit_tree != start)
+        return {'FINISHED'}
+
+class CCC_OT_pie_page(bpy.types.Operator):
+    bl_idname="ccc.pie_page"; bl_label="Page"; bl_options={'INTERNAL'}
+    side:bpy.props.EnumProperty(items=[('UP',"Sources",""),('DOWN',"Targets","")])
+    delta:bpy.props.IntProperty()
+    def execute(self,context):
+        if not (pie := current_pie_entries()): return {'CANCELLED'}
+        pie.page[self.side] = (pie.page[self.side] + self.delta) % pie.pages(self.side)
+        bpy.ops.wm.call_menu_pie(name=CCC_MT_pie_menu.bl_idname)
+        return {'FINISHED'}
+
+USAGE_BUDGET = 0.002
+PIN_WATCH_INTERVAL = 0.5
+_jump_pins = {}   # space pointer -> (tree pointer, pin state before the jump)
+
+def _pin_watch():
+    """Give a space its own pin state back once it no longer shows the tree a jump pinned it to."""
+    # Space data is no ID: a kept wrapper would read freed memory once its area closes,
+    # so spaces are looked up again by pointer through the open windows.
+    spaces = {sp.as_pointer(): sp for win in bpy.context.window_manager.windows for area in win.screen.areas
+              for sp in area.spaces if sp.as_pointer() in _jump_pins}
+    for p, (tree, was_pinned) in list(_jump_pins.items()):
+        if (space := spaces.get(p)) is None or not space.pin: del _jump_pins[p]
+        elif not space.path or space.path[0].node_tree.as_pointer() != tree: space.pin = was_pinned; del _jump_pins[p]
+    return PIN_WATCH_INTERVAL if _jump_pins else None
+
+def clear_jump_pins():
+    _jump_pins.clear()
+    if bpy.app.timers.is_registered(_pin_watch): bpy.app.timers.unregister(_pin_watch)
+
+class CCC_OT_jump_to_tree(bpy.types.Operator):
+    bl_idname="ccc.jump_to_tree"; bl_label="Jump to Tree"; bl_options={'REGISTER'}
+    owner_type:bpy.props.StringProperty()
+    owner_name:bpy.props.StringProperty()
+    node_name:bpy.props.StringProperty()
+    def execute(self,context):
+        if context.area.type!='NODE_EDITOR' or (tree := owner_tree((self.owner_type, self.owner_name))) is None: return {'CANCELLED'}
+        space = context.space_data; switched = space.edit_tree != tree
+        if space.tree_type != tree.bl_idname: space.tree_type = tree.bl_idname
+        if switched:
+            if self.owner_type == 'WORLD': space.shader_type = 'WORLD'
+            p = space.as_pointer(); was_pinned = _jump_pins[p][1] if p in _jump_pins else space.pin
+            space.pin = True; space.path.start(tree); _jump_pins[p] = (tree.as_pointer(), was_pinned)
+            if not bpy.app.timers.is_registered(_pin_watch): bpy.app.timers.register(_pin_watch, first_interval=PIN_WATCH_INTERVAL)
+        if not (node := tree.nodes.get(self.node_name)): return {'CANCELLED'}
+        jump_to(context.window, context.area, node, deferred=switched)
+        return {'FINISHED'}
+
+class CCC_OT_search_nodes(bpy.types.Operator):
+    """Jump to any node of the tree by fuzzy name or label, nearest to the active node first"""
+    bl_idname="node.ccc_search_nodes"; bl_label="Search and Jump"
+    query:bpy.props.StringProperty(name="Search",options={'TEXTEDIT_UPDATE','SKIP_SAVE'})
+    @classmethod
+    def poll(cls, context):
+        return context.area and context.area.type=='NODE_EDITOR' and context.space_data.edit_tree is not None
+    def invoke(self,context,event):
+        tree = context.space_data.edit_tree
+        self._index = get_node_index(tree); self._distances = node_distances(tree, tree.nodes.active)
+        self._results = (None, [])
+        return context.window_manager.invoke_popup(self, width=360)
+    def draw(self,context):
+        layout = self.layout; layout.activate_init = True
+        layout.prop(self, "query", text="", icon='VIEWZOOM')
+        if self._results[0] != self.query: self._results = (self.query, search_nodes(self._index, self.query, self._distances))
+        col = layout.column(align=True)
+        for nd in self._results[1]:
+            try: text = f"{nd.label} ({nd.name})" if nd.label else nd.name
+            except ReferenceError: continue
+            col.operator(CCC_OT_jump_to_node.bl_idname, text=text).node_name = nd.name
+    def execute(self,context):
+        if (hits := getattr(self, "_results", (None, []))[1]):
+            bpy.ops.ccc.jump_to_node(node_name=hits[0].name)
         return {'FINISHED'}
 
 class CCC_MT_pie_menu(bpy.types.Menu):
     bl_idname = "CCC_MT_pie_menu"; bl_label = "Connection Jumper"
     def draw(self, context):
-        layout = self.layout; pie = layout.menu_pie(); wm = context.window_manager
+        layout = self.layout; pie = layout.menu_pie()
         if not (tree := context.space_data.edit_tree): return
         prefs = bpy.context.preferences.addons[__package__].preferences
         lang = getattr(prefs, "language", bpy.context.preferences.view.language)
@@ -280,66 +714,209 @@ class CCC_MT_pie_menu(bpy.types.Menu):
             lang = "en"
         from .lang_dict import LANG_DICT
         t = LANG_DICT.get(lang, LANG_DICT["en"])
-        left_box = pie.box(); left_col = left_box.column(align=True); left_col.label(text=t["sources"])
-        left_ops = left_col.column(align=True); left_ops.alert = True
-        if (upstreams := getattr(wm, "ccc_upstreams", "")):
-            for item in upstreams.split("|"):
-                nn, ss = item.split("::", 1)
-                if (nd := tree.nodes.get(nn)):
-                    op = left_ops.operator(CCC_OT_jump_to_node.bl_idname, text=f"{nd.label or nd.name} -> {ss}")
-                    op.node_name = nn; left_ops.scale_x = 2.0; left_ops.scale_y = 2.0
-        else: left_ops.label(text=t["none"], icon='NONE')
-        right_box = pie.box(); right_col = right_box.column(align=True); right_col.label(text=t["targets"])
-        right_ops = right_col.column(align=True); right_ops.alert = True
-        if (downstreams := getattr(wm, "ccc_downstreams", "")):
-            for item in downstreams.split("|"):
-                nn, ss = item.split("::", 1)
-                if (nd := tree.nodes.get(nn)):
-                    op = right_ops.operator(CCC_OT_jump_to_node.bl_idname, text=f"{nd.label or nd.name} -> {ss}")
-                    op.node_name = nn; right_ops.scale_x = 2.0; right_ops.scale_y = 2.0
-        else: right_ops.label(text=t["none"], icon='NONE')
+        if not (entries := current_pie_entries()): return
+        for side, title in (('UP', t["sources"]), ('DOWN', t["targets"])):
+            box = pie.box(); col = box.column(align=True); rows = entries.sides[side]
+            col.label(text=f"{title} {len(rows)}" if len(rows) > PIE_PAGE_SIZE else title)
+            ops = col.column(align=True); ops.alert = True
+            if not rows: ops.label(text=t["none"], icon='NONE'); continue
+            ops.scale_x = 2.0; ops.scale_y = 2.0; section = None
+            for i, (label, levels, path, sock) in entries.visible(side):
+                try: nd = sock.node; text = f"{nd.label or nd.name} -> {sock.name}"
+                except ReferenceError: continue
+                if label != section:
+                    section = label
+                    if label: ops.label(text=label, icon='NODETREE')
+                op = ops.operator(CCC_OT_jump_to_node.bl_idname, text=text); op.side = side; op.index = i
+            if (n := entries.pages(side)) > 1:
+                row = col.row(align=True)
+                op = row.operator(CCC_OT_pie_page.bl_idname, text="", icon='TRIA_LEFT'); op.side = side; op.delta = -1
+                row.label(text=f"{entries.page[side] + 1} / {n}")
+                op = row.operator(CCC_OT_pie_page.bl_idname, text="", icon='TRIA_RIGHT'); op.side = side; op.delta = 1
+        if entries.group is not None:
+            try: users = group_users(entries.group, USAGE_BUDGET)
+            except ReferenceError: return
+            users_box = pie.box(); users_col = users_box.column(align=True); users_col.label(text=t["used_in"])
+            if users is None: users_col.label(text=t["indexing"], icon='TIME'); return
+            for (kind, name), node_names in users.items():
+                for nn in node_names:
+                    op = users_col.operator(CCC_OT_jump_to_tree.bl_idname, text=f"{kind.title()}: {name} / {nn}")
+                    op.owner_type = kind; op.owner_name = name; op.node_name = nn
+
+_dead_areas = set()   # areas whose running highlighter already outlines dead branches
+
+class CCC_OT_find_dead_nodes(bpy.types.Operator):
+    """Find nodes that reach no output node and outputs that lead nowhere, and keep them outlined"""
+    bl_idname="node.ccc_find_dead_nodes"; bl_label="Find Dead Nodes"; bl_options={'REGISTER'}
+    select:bpy.props.BoolProperty(name="Select",description="Select the dead nodes",default=False)
+    @classmethod
+    def poll(cls, context):
+        return context.area and context.area.type=='NODE_EDITOR' and context.space_data.edit_tree is not None
+    def execute(self,context):
+        tree = context.space_data.edit_tree; nodes, ptrs = find_dead_nodes(tree)
+        if self.select:
+            for nd in tree.nodes: nd.select = False
+            for nd in nodes: nd.select = True
+            # Only a selection change is worth an undo step.
+            bpy.ops.ed.undo_push(message="Select Dead Nodes")
+        self.report({'INFO'}, f"{len(nodes)} dead nodes, {len(ptrs)} outputs leading nowhere")
+        return {'FINISHED'}
+    def invoke(self,context,event):
+        res = self.execute(context)
+        if context.area.as_pointer() not in _dead_areas: bpy.ops.node.ccc_modal_link_highlighter('INVOKE_DEFAULT', mode='DEAD')
+        return res
+
+class CCC_OT_clear_pins(bpy.types.Operator):
+    """Unpin every highlighted chain of the current tree"""
+    bl_idname="node.ccc_clear_pins"; bl_label="Clear Pinned Chains"
+    @classmethod
+    def poll(cls, context):
+        return context.area and context.area.type=='NODE_EDITOR' and context.space_data.edit_tree is not None
+    def execute(self,context):
+        clear_pins(context.space_data.edit_tree)
+        return {'FINISHED'}
 
 
 class CCC_OT_modal_link_highlighter(bpy.types.Operator):
     bl_idname="node.ccc_modal_link_highlighter";bl_label="CCC Link Highlighter"
+    mode:bpy.props.EnumProperty(items=[('CHAIN',"Chain","Highlight the chain under the cursor"),
+                                       ('OVERVIEW',"Overview","Also draw every link of the tree"),
+                                       ('DEAD',"Dead Branches","Also outline nodes that reach no output and outputs that lead nowhere")],default='CHAIN')
+    overview_color:bpy.props.EnumProperty(items=[('FANOUT',"Fan-out","Color links by the number of targets of their chain"),
+                                                 ('DEPTH',"Depth","Color links by hop depth from the tree's sources")],default='FANOUT')
+    cone:bpy.props.EnumProperty(name="Dependency Cone",items=[('NONE',"Chain Only","Highlight only the hovered chain"),
+                                                             ('UPSTREAM',"Upstream","Also highlight everything feeding the chain"),
+                                                             ('DOWNSTREAM',"Downstream","Also highlight everything the chain feeds"),
+                                                             ('BOTH',"Both","Highlight the full upstream and downstream cone")],default='NONE')
+    cone_depth:bpy.props.IntProperty(name="Cone Depth",description="Hop limit for the dependency cone (0 = unlimited)",default=0,min=0)
+    link_color:bpy.props.EnumProperty(name="Link Color",items=[('SOCKET',"Socket Type","Color links by the data type of the socket that feeds them"),
+                                                              ('WHITE',"White","Draw every highlighted link in white")],default='SOCKET')
+    distance_tint:bpy.props.BoolProperty(name="Distance Tint",description="Darken links the farther they are from the hovered socket",default=False)
     def modal(self,context,event):
         if not self.active or not context.area or context.area!=self.active_area: self.cleanup(context); return {'CANCELLED'}
-        current_mouse_pos = (event.mouse_region_x, event.mouse_region_y)
-        if event.type == 'MOUSEMOVE':
-            dx = current_mouse_pos[0] - self.last_mouse_pos[0]
-            dy = current_mouse_pos[1] - self.last_mouse_pos[1]
-            if (dx*dx + dy*dy) > 4.0:
-                self.mouse_pos = current_mouse_pos
-                self.last_mouse_pos = current_mouse_pos
-                context.area.tag_redraw()
-            else:
-                self.mouse_pos = current_mouse_pos
+        if event.type == 'MOUSEMOVE': self.mouse_pos = (event.mouse_region_x, event.mouse_region_y)
+        if event.type in {'MOUSEMOVE', 'TIMER'}:
+            # update_hover first: a changed tree restarts the build before it touches stale data.
+            changed = self.update_hover(context)
+            if event.type == 'TIMER' and self._job is not None: changed = self.step_job() or changed
+            if changed: context.area.tag_redraw()
+        self._sync_timer(context)
         if event.type=='LEFTMOUSE' and event.value=='PRESS' and self.start_socket:
-            wm, active_node = context.window_manager, self.start_socket.node
-            upstreams = [f"{n.name}::{s.name}" for s_in in active_node.inputs if (res := find_ultimate_source(s_in)) and (s:=res[0]) and (n:=res[1])]
-            downstreams = [f"{ts.node.name}::{ts.name}" for s_out in active_node.outputs for ts in find_ultimate_targets(s_out)]
-            wm.ccc_upstreams = "|".join(dict.fromkeys(upstreams))
-            wm.ccc_downstreams = "|".join(dict.fromkeys(downstreams))
+            open_pie_entries(context.space_data, self.start_socket)
             bpy.ops.wm.call_menu_pie(name=CCC_MT_pie_menu.bl_idname)
             self.cleanup(context); return {'FINISHED'}
+        if event.type=='P' and event.value=='PRESS':
+            if event.shift: clear_pins(context.space_data.edit_tree); return {'RUNNING_MODAL'}
+            if self.start_socket: toggle_pin(self.start_socket); return {'RUNNING_MODAL'}
         if event.type in {'RIGHTMOUSE','ESC'}: self.cleanup(context); return {'CANCELLED'}
         return {'PASS_THROUGH'}
 
+    def update_hover(self, context):
+        """Re-evaluate the hovered socket; returns True when the highlight changed."""
+        region = context.region; ui = context.preferences.system.ui_scale
+        if not region or region.type != 'WINDOW' or not (tree := getattr(context.space_data, "edit_tree", None)):
+            return self._set_hover(None, None)
+        v2d = region.view2d; mx, my = self.mouse_pos; key = _tree_key(tree, ui)
+        if not self.follow_nodes(context, tree, ui, key): return self._set_hover(None, key)
+        cand_key = (key, view_affine(v2d), self._moves); ax, ay = self._cand_at
+        # Candidates cover HOVER_MARGIN around the last query point, so they stay valid
+        # for any cursor within the slack left over after the hover radius.
+        slack = (HOVER_MARGIN - HOVER_RADIUS) * ui
+        if cand_key != self._cand_key or (mx - ax)**2 + (my - ay)**2 > slack * slack:
+            vx, vy = v2d.region_to_view(mx, my)
+            pad = (HOVER_MARGIN * ui + 6 * ui) * view_per_px(v2d, mx, my)
+            socks = [s for node in self._node_grid.query(vx, vy, pad) for s in chain(node.inputs, node.outputs) if s.is_linked and s.enabled]
+            locs, valid = read_socket_locations([s.as_pointer() for s in socks], tree, socks)
+            sx, sy, ox, oy = cand_key[1]
+            self._candidates = [s for s, v in zip(socks, valid) if v]
+            self._cand_pos = locs[valid] * np.array((sx, sy), dtype=np.float32) + np.array((ox, oy), dtype=np.float32)
+            self._cand_key, self._cand_at = cand_key, (mx, my)
+        bs = None
+        if self._candidates:
+            d = ((self._cand_pos - np.array((mx, my), dtype=np.float32))**2).sum(axis=1); i = int(d.argmin())
+            if d[i] < (HOVER_RADIUS * ui)**2: bs = self._candidates[i]
+        return self._set_hover(bs, key)
+
+    def follow_nodes(self, context, tree, ui, key):
+        """Keep the node grid current, building it in HOVER_BUDGET slices; False until it is ready.
+
+        ``_moves`` counts drags, which move nodes without a tree update.
+        """
+        if (grid := self._node_grid) is not None and grid.key == key:
+            if (moved := grid.follow(getattr(context, "selected_nodes", None) or [], ui)) is not None:
+                if moved: self._moves += 1
+                return True
+            self._moves += 1
+        self._node_grid = None
+        if self._grid_job is None or self._grid_job[0] != key: self._grid_job = (key, iter_node_grid(tree, ui, key))
+        deadline = time.perf_counter() + HOVER_BUDGET
+        try:
+            while time.perf_counter() < deadline: next(self._grid_job[1])
+            return False
+        except StopIteration as done: self._node_grid = done.value
+        except ReferenceError: pass
+        self._grid_job = None
+        return self._node_grid is not None
+
+    def _set_hover(self, socket, key):
+        ptr = socket.as_pointer() if socket else 0
+        if key == self._hover_key and ptr == (self.start_socket.as_pointer() if self.start_socket else 0): return False
+        if key != self._hover_key: self._chain_memo.clear()
+        # A new hover drops any unfinished build for the previous one.
+        self._hover_key, self.start_socket, self._job = key, socket, None
+        if not socket: self.highlight = None; return True
+        if (hl := self._chain_memo.get(ptr, False)) is False:
+            self.highlight = None; self._job_ptr = ptr
+            self._job = iter_highlight(socket, key[3], self.cone, self.cone_depth, self.link_color == 'SOCKET')
+            self.step_job()
+        else: self.highlight = hl
+        return True
+
+    def step_job(self):
+        """Advance the pending highlight build for one time slice; True when there is more to draw."""
+        deadline, changed = time.perf_counter() + HOVER_BUDGET, False
+        try:
+            while True:
+                if (part := next(self._job)) is not None: self.highlight = part; changed = True
+                if time.perf_counter() > deadline: return changed
+        except StopIteration as done:
+            self.highlight = self._chain_memo[self._job_ptr] = done.value
+        except ReferenceError: self.highlight = None
+        self._job = None
+        return True
+
+    def _sync_timer(self, context):
+        """Keep a window timer running only while a highlight or grid build is pending."""
+        pending = self._job is not None or self._grid_job is not None
+        if pending and self._timer is None:
+            self._timer = context.window_manager.event_timer_add(1.0 / 60.0, window=context.window)
+        elif not pending and self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer); self._timer = None
+
     def invoke(self,context,event):
         v={'ShaderNodeTree','CompositorNodeTree','GeometryNodeTree'}
         if context.area.type=='NODE_EDITOR' and context.space_data.tree_type in v:
-            self.active=True; self.start_socket=None
-            self.mouse_pos=(event.mouse_region_x,event.mouse_region_y); self.last_mouse_pos = self.mouse_pos
-            self.active_area=context.area; self._sock_cache = {}; self._color_cache = {}
-            self.links_chain, self.chain_targets = set(), set()
-            self._shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-            self._draw_handle = bpy.types.SpaceNodeEditor.draw_handler_add(draw_callback_px,(self,context),'WINDOW','POST_PIXEL')
+            self.active=True; self.start_socket=None; self._area_ptr = context.area.as_pointer()
+            if self.mode == 'DEAD': _dead_areas.add(self._area_ptr)
+            self.mouse_pos=(event.mouse_region_x,event.mouse_region_y)
+            self.active_area=context.area
+            if select_layout(context.space_data.edit_tree, context.preferences.system.ui_scale):
+                self.report({'WARNING'}, "Unverified socket layout for this Blender build; using slower estimated socket positions")
+            self._node_grid = self._grid_job = None; self._moves = 0
+            self._cand_key = None; self._cand_at = self.mouse_pos; self._candidates = []; self._cand_pos = None
+            self._hover_key = None; self._chain_memo = {}; self._job = None; self._timer = None
+            self.highlight = None
+            self.update_hover(context)
+            self._shader = gpu.shader.from_builtin('FLAT_COLOR'); self._batch = self._batch_key = None
+            self._overview_key = self._overview_curves = self._overview = None
+            self._dead_key = self._dead_batch_key = self._dead_batch = None
+            self._draw_handle = bpy.types.SpaceNodeEditor.draw_handler_add(_draw_callback,(self,context),'WINDOW','POST_PIXEL')
             context.window_manager.modal_handler_add(self); context.area.tag_redraw(); return {'RUNNING_MODAL'}
         return {'CANCELLED'}
         
     def cleanup(self,context):
         if getattr(self,"active",False):
-            self.active=False
+            self.active=False; self._job = self._grid_job = None; self._sync_timer(context); _dead_areas.discard(self._area_ptr)
             if hasattr(self, '_draw_handle') and self._draw_handle:
                 bpy.types.SpaceNodeEditor.draw_handler_remove(self._draw_handle,'WINDOW')
             if context.area: context.area.tag_redraw()
\ No newline at end of file
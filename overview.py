@@ -0,0 +1,94 @@
+import gpu, colorsys
+import numpy as np
+from gpu_extras.batch import batch_for_shader
+
+OVERVIEW_SEGS = 32
+TEXELS_PER_LINK = 3
+TEX_WIDTH = 4096
+
+_VERT_SRC = """
+vec4 fetch(int k)
+{
+  int w = textureSize(ctrl_tex, 0).x;
+  return texelFetch(ctrl_tex, ivec2(k % w, k / w), 0);
+}
+
+void main()
+{
+  int base = gl_InstanceID * 3;
+  vec4 a = fetch(base);
+  vec4 b = fetch(base + 1);
+  v_color = fetch(base + 2);
+  float t = tpos.x;
+  float u = 1.0 - t;
+  vec2 p = u * u * u * a.xy + 3.0 * u * u * t * a.zw + 3.0 * u * t * t * b.xy + t * t * t * b.zw;
+  vec2 d = 3.0 * u * u * (a.zw - a.xy) + 6.0 * u * t * (b.xy - a.zw) + 3.0 * t * t * (b.zw - b.xy);
+  p = p * affine.xy + affine.zw;
+  d = d * affine.xy;
+  float len = length(d);
+  vec2 n = len > 0.0 ? vec2(-d.y, d.x) / len : vec2(0.0, 1.0);
+  gl_Position = ModelViewProjectionMatrix * vec4(p + n * (tpos.y * half_width), 0.0, 1.0);
+}
+"""
+
+_FRAG_SRC = """
+void main()
+{
+  FragColor = v_color;
+}
+"""
+
+_shader = None
+
+def overview_shader():
+    """Instanced curve shader evaluating link Beziers on the GPU; None where it cannot be built."""
+    global _shader
+    if _shader is None:
+        try:
+            iface = gpu.types.GPUStageInterfaceInfo("ccc_overview_iface")
+            iface.smooth('VEC4', "v_color")
+            info = gpu.types.GPUShaderCreateInfo()
+            info.push_constant('MAT4', "ModelViewProjectionMatrix")
+            info.push_constant('VEC4', "affine")
+            info.push_constant('FLOAT', "half_width")
+            info.sampler(0, 'FLOAT_2D', "ctrl_tex")
+            info.vertex_in(0, 'VEC2', "tpos")
+            info.vertex_out(iface)
+            info.fragment_out(0, 'VEC4', "FragColor")
+            info.vertex_source(_VERT_SRC); info.fragment_source(_FRAG_SRC)
+            _shader = gpu.shader.create_from_info(info)
+        except Exception: _shader = False
+    return _shader or None
+
+def ramp_colors(values, alpha=0.8):
+    """Blue (low) to red (high) on a log scale, one RGBA row per value."""
+    vals, inv = np.unique(np.asarray(values, dtype=np.float64), return_inverse=True)
+    top = np.log1p(vals.max()) if len(vals) else 1.0
+    lut = np.array([(*colorsys.hsv_to_rgb(0.66 * (1.0 - (np.log1p(v) / top if top else 0.0)), 0.85, 1.0), alpha) for v in vals], dtype=np.float32)
+    return lut[inv.reshape(-1)] if len(vals) else np.empty((0, 4), np.float32)
+
+class LinkOverview:
+    """Whole-tree link curves uploaded once; per frame only the view affine and width change.
+
+    Control points and colors live in an RGBA32F texture (three texels per link)
+    and one TRI_STRIP template is drawn once per link instance.
+    """
+    __slots__ = ("key", "count", "texture", "batch")
+
+    def __init__(self, ctrl, colors, key=None):
+        self.key = key; self.count = n = len(ctrl)
+        data = np.zeros((n, TEXELS_PER_LINK, 4), dtype=np.float32)
+        data[:, :2] = np.asarray(ctrl, dtype=np.float32).reshape(n, 2, 4); data[:, 2] = colors
+        texels = max(1, n * TEXELS_PER_LINK); w = min(texels, TEX_WIDTH); h = -(-texels // w)
+        flat = np.zeros(w * h * 4, dtype=np.float32); flat[:data.size] = data.ravel()
+        self.texture = gpu.types.GPUTexture((w, h), format='RGBA32F', data=gpu.types.Buffer('FLOAT', len(flat), flat))
+        t = np.repeat(np.linspace(0.0, 1.0, OVERVIEW_SEGS + 1), 2)
+        side = np.tile((-1.0, 1.0), OVERVIEW_SEGS + 1)
+        self.batch = batch_for_shader(overview_shader(), 'TRI_STRIP', {"tpos": np.stack((t, side), axis=1).astype(np.float32)})
+
+    def draw(self, affine, width):
+        sh = overview_shader()
+        sh.bind()
+        sh.uniform_float("affine", affine); sh.uniform_float("half_width", width * 0.5)
+        sh.uniform_sampler("ctrl_tex", self.texture)
+        self.batch.draw_instanced(sh, instance_count=self.count)
@@ -0,0 +1,128 @@
+import bpy, blf, csv, json, time
+from array import array
+from functools import wraps
+from . import operators, sockets
+
+RING_SIZE = 512
+HUD_FONT_PX = 11
+HUD_MARGIN = 12
+
+# (stage, owner, attribute). Stages nest: "batch" includes "strokes", "frame" includes
+# everything drawn in one redraw. "submit" is CPU-side submission only; the GPU runs async.
+STAGES = (("modal", operators.CCC_OT_modal_link_highlighter, "modal"),
+          ("hit_test", operators.CCC_OT_modal_link_highlighter, "update_hover"),
+          ("traversal", operators.CCC_OT_modal_link_highlighter, "step_job"),
+          ("curves", operators, "bezier_verts_from_links"),
+          ("strokes", operators, "stroke_polylines"),
+          ("strokes", operators, "line_segments"),
+          ("batch", operators, "build_highlight_batch"),
+          ("submit", operators, "submit_batch"),
+          ("frame", operators, "draw_callback_px"))
+
+class Ring:
+    """Fixed-size ring of nanosecond samples."""
+    __slots__ = ("data", "n")
+
+    def __init__(self):
+        self.data = array('q', [0]) * RING_SIZE; self.n = 0
+
+    def add(self, v):
+        self.data[self.n % RING_SIZE] = v; self.n += 1
+
+    def samples(self):
+        if self.n <= RING_SIZE: return self.data[:self.n].tolist()
+        i = self.n % RING_SIZE
+        return self.data[i:].tolist() + self.data[:i].tolist()
+
+    def stats(self):
+        """(p50, p95, max) in nanoseconds."""
+        if not (s := sorted(self.samples())): return 0, 0, 0
+        return s[len(s) // 2], s[min(len(s) - 1, len(s) * 95 // 100)], s[-1]
+
+rings = {}
+counts = {"nodes": 0, "links": 0, "verts": 0}
+_originals = []
+_hud = None
+
+def _timed(ring, fn):
+    ns = time.perf_counter_ns
+    @wraps(fn)
+    def timed(*args, **kw):
+        t = ns()
+        try: return fn(*args, **kw)
+        finally: ring.add(ns() - t)
+    return timed
+
+def _counted(fn):
+    @wraps(fn)
+    def counted(*args, **kw):
+        # The stroke stages run inside build_highlight_batch and add their vertices as they go.
+        if (batch := fn.__name__ == "build_highlight_batch"): counts["verts"] = 0
+        res = fn(*args, **kw)
+        if batch: counts["nodes"], counts["links"] = len(args[1]), len(args[3])
+        else: counts["verts"] += len(res[0])
+        return res
+    return counted
+
+def is_enabled():
+    return bool(_originals)
+
+def set_enabled(on):
+    """Install or remove the timing wrappers; while off, no stage runs any extra code."""
+    global _hud
+    if on == is_enabled(): return
+    if on:
+        for stage, owner, attr in STAGES:
+            fn = getattr(owner, attr); _originals.append((owner, attr, fn))
+            if attr in {"build_highlight_batch", "stroke_polylines", "line_segments"}: fn = _counted(fn)
+            setattr(owner, attr, _timed(rings.setdefault(stage, Ring()), fn))
+        _hud = bpy.types.SpaceNodeEditor.draw_handler_add(draw_hud, (), 'WINDOW', 'POST_PIXEL')
+    else:
+        for owner, attr, fn in reversed(_originals): setattr(owner, attr, fn)
+        _originals.clear()
+        if _hud is not None: bpy.types.SpaceNodeEditor.draw_handler_remove(_hud, 'WINDOW'); _hud = None
+
+def hud_lines():
+    lines = ["stage        p50     p95     max  (us)"]
+    for stage, ring in rings.items():
+        p50, p95, mx = ring.stats()
+        lines.append(f"{stage:<10}{p50 / 1e3:>8.0f}{p95 / 1e3:>8.0f}{mx / 1e3:>8.0f}")
+    lines.append(f"nodes {counts['nodes']}  links {counts['links']}  verts {counts['verts']}")
+    lines.append("socket positions: " + ("ctypes" if sockets.fast_path() else "RNA estimate"))
+    return lines
+
+def draw_hud():
+    region = bpy.context.region
+    if not region or region.type != 'WINDOW': return
+    ui = bpy.context.preferences.system.ui_scale; font = 0; step = (HUD_FONT_PX + 4) * ui
+    blf.size(font, HUD_FONT_PX * ui); blf.color(font, 1.0, 1.0, 1.0, 0.9)
+    y = region.height - HUD_MARGIN * ui
+    for line in hud_lines():
+        y -= step; blf.position(font, HUD_MARGIN * ui, y, 0); blf.draw(font, line)
+
+def export(path):
+    """Write every stage's samples to ``path`` as JSON, or CSV for a .csv path."""
+    if path.lower().endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            w = csv.writer(f); w.writerow(("stage", "sample", "ns"))
+            for stage, ring in rings.items(): w.writerows((stage, i, v) for i, v in enumerate(ring.samples()))
+    else:
+        from . import bl_info
+        data = {"addon_version": list(bl_info["version"]), "blender": list(bpy.app.version), "ring_size": RING_SIZE,
+                "counts": counts, "stages": {stage: ring.samples() for stage, ring in rings.items()}}
+        with open(path, "w") as f: json.dump(data, f, indent=1)
+
+def reset():
+    rings.clear(); counts.update(nodes=0, links=0, verts=0)
+
+class CCC_OT_profile_export(bpy.types.Operator):
+    """Save the collected highlighter timings as JSON or CSV"""
+    bl_idname="ccc.profile_export"; bl_label="Export Profiling Samples"
+    filepath:bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob:bpy.props.StringProperty(default="*.json;*.csv",options={'HIDDEN'})
+    def invoke(self,context,event):
+        if not self.filepath: self.filepath = "nodelink_profile.json"
+        context.window_manager.fileselect_add(self); return {'RUNNING_MODAL'}
+    def execute(self,context):
+        export(bpy.path.abspath(self.filepath)); self.report({'INFO'}, f"Saved {self.filepath}")
+        return {'FINISHED'}
@@ -0,0 +1,78 @@
+import re
+from .graph import get_tree_graph
+
+SEARCH_LIMIT = 30
+_WORD = re.compile(r"[^\W_]+")
+_indexes = {}
+
+def trigrams(text):
+    """Trigrams of every word of ``text``, each word padded so one or two letters still match its start."""
+    out = set()
+    for w in _WORD.findall(text.lower()):
+        w = "  " + w; out.update(w[i:i + 3] for i in range(len(w) - 2))
+    return out
+
+class NodeIndex:
+    """Trigram index over the node names and labels of one tree.
+
+    ``sync`` re-reads names and only re-indexes nodes that were added, removed
+    or renamed, so a query never scans the tree.
+    """
+    __slots__ = ("entries", "nodes", "postings")
+
+    def __init__(self):
+        self.entries, self.nodes, self.postings = {}, {}, {}
+
+    def _drop(self, p):
+        _, grams = self.entries.pop(p); self.nodes.pop(p, None)
+        for g in grams:
+            if (ps := self.postings.get(g)) is not None:
+                ps.discard(p)
+                if not ps: del self.postings[g]
+
+    def _put(self, p, text):
+        grams = trigrams(text); self.entries[p] = (text, grams)
+        for g in grams: self.postings.setdefault(g, set()).add(p)
+
+    def sync(self, tree):
+        seen = set()
+        for nd in tree.nodes:
+            if nd.bl_idname == 'NodeReroute': continue
+            p = nd.as_pointer(); text = f"{nd.name} {nd.label}" if nd.label else nd.name
+            seen.add(p)
+            if (e := self.entries.get(p)) is None or e[0] != text:
+                if e is not None: self._drop(p)
+                self._put(p, text)
+            self.nodes[p] = nd
+        for p in self.entries.keys() - seen: self._drop(p)
+
+    def query(self, text):
+        """Node pointer -> share of the query's trigrams it contains, for nodes matching at least half."""
+        if not (q := trigrams(text)): return {}
+        counts = {}
+        for g in q:
+            for p in self.postings.get(g, ()): counts[p] = counts.get(p, 0) + 1
+        need = (len(q) + 1) // 2
+        return {p: c / len(q) for p, c in counts.items() if c >= need}
+
+def get_node_index(tree):
+    p = tree.as_pointer()
+    if (idx := _indexes.get(p)) is None: idx = _indexes[p] = NodeIndex()
+    idx.sync(tree)
+    return idx
+
+def node_distances(tree, node):
+    """Node pointer -> undirected hop distance from ``node``; empty when it has no links."""
+    g = get_tree_graph(tree)
+    if node is None or (n := g.node_index().get(node.as_pointer())) is None: return {}
+    ptrs = list(g.node_index())
+    return {ptrs[m]: d for m, d in g.node_distances(n).items()}
+
+def search_nodes(index, text, distances, limit=SEARCH_LIMIT):
+    """Best matches for ``text``: match quality first, then graph distance, then name."""
+    hits = index.query(text); inf = float("inf")
+    ranked = sorted(hits, key=lambda p: (-round(hits[p], 1), distances.get(p, inf), index.entries[p][0]))
+    return [index.nodes[p] for p in ranked[:limit]]
+
+def clear():
+    _indexes.clear()
@@ -0,0 +1,149 @@
+import bpy, ctypes
+import numpy as np
+from .graph import peek_tree_graph
+from .spatial import node_view_bounds
+
+VALIDATE_SOCKETS = 16
+VALIDATE_PAD = 30.0
+NODE_HEADER = 20.0
+SOCKET_ROW = 22.0
+
+class StructBase(ctypes.Structure):
+    _subclasses=[]; __annotations__={}
+    def __init_subclass__(cls): cls._subclasses.append(cls)
+    @staticmethod
+    def _init_structs():
+        ft=type(lambda:None)
+        for cls in StructBase._subclasses:
+            fields=[]
+            for k,v in cls.__annotations__.items():
+                if isinstance(v,ft): v=v()
+                fields.append((k,v))
+            if fields: cls._fields_=fields
+            cls.__annotations__.clear()
+        StructBase._subclasses.clear()
+
+class Layout:
+    """One ``bNodeSocket`` layout: the struct plus the offsets the fast reader needs."""
+    __slots__ = ("name", "socket", "runtime_offset", "location_offset")
+
+    def __init__(self, name, socket, runtime):
+        self.name, self.socket = name, socket
+        self.runtime_offset, self.location_offset = socket.runtime.offset, runtime.location.offset
+
+def _layout_4_5():
+    class BNodeSocketRuntimeHandle(StructBase):
+        _pad0: ctypes.c_char*8; declaration: ctypes.c_void_p; changed_flag: ctypes.c_uint32
+        total_inputs: ctypes.c_short; _pad1: ctypes.c_char*2; location: ctypes.c_float*2
+    class BNodeStack(StructBase):
+        vec: ctypes.c_float*4; min: ctypes.c_float; max: ctypes.c_float
+        data: ctypes.c_void_p; hasinput: ctypes.c_short; hasoutput: ctypes.c_short
+        datatype: ctypes.c_short; sockettype: ctypes.c_short; is_copy: ctypes.c_short
+        external: ctypes.c_short; _pad: ctypes.c_char*4
+    class BNodeSocket(StructBase):
+        next: ctypes.c_void_p; prev: ctypes.c_void_p; prop: ctypes.c_void_p
+        identifier: ctypes.c_char*64; name: ctypes.c_char*64; storage: ctypes.c_void_p
+        in_out: ctypes.c_short; typeinfo: ctypes.c_void_p; idname: ctypes.c_char*64
+        default_value: ctypes.c_void_p; _pad: ctypes.c_char*4; label: ctypes.c_char*64
+        description: ctypes.c_char*64; short_label: ctypes.c_char*64
+        default_attribute_name: ctypes.POINTER(ctypes.c_char); to_index: ctypes.c_int
+        link: ctypes.c_void_p; ns: BNodeStack; runtime: ctypes.POINTER(BNodeSocketRuntimeHandle)
+    StructBase._init_structs()
+    return Layout("4.5", BNodeSocket, BNodeSocketRuntimeHandle)
+
+# (first Blender version, layout factory), oldest first. The newest entry not newer than
+# the running build is tried; a build past the last entry only keeps it if validation passes.
+LAYOUTS = (((4, 5, 0), _layout_4_5),)
+
+_layout = None      # verified Layout, False for the RNA fallback, None until decided
+_candidate = None
+
+def _read(layout, ptrs):
+    ptrs = np.asarray(ptrs, dtype=np.uint64)
+    rt = np.zeros(len(ptrs), dtype=np.uint64); locs = np.zeros((len(ptrs), 2), dtype=np.float32)
+    mm, rt_addr, loc_addr = ctypes.memmove, rt.ctypes.data, locs.ctypes.data
+    ro, lo = layout.runtime_offset, layout.location_offset
+    for i, p in enumerate(ptrs.tolist()): mm(rt_addr + 8 * i, p + ro, 8)
+    valid = rt != 0
+    for i, r in zip(np.nonzero(valid)[0].tolist(), rt[valid].tolist()): mm(loc_addr + 8 * i, r + lo, 8)
+    return locs, valid
+
+def _check(layout, tree, ui):
+    """Compare ``layout`` against RNA on a few linked inputs of ``tree``; None when there is nothing to sample."""
+    samples = []
+    for nd in tree.nodes:
+        if nd.hide or nd.bl_idname in {'NodeReroute', 'NodeFrame'}: continue
+        samples += [s for s in nd.inputs if s.is_linked and s.enabled and not s.hide and not s.is_multi_input]
+        if len(samples) >= VALIDATE_SOCKETS: break
+    if not samples: return None
+    # Only fields inside the socket struct are read until they all match RNA; the runtime
+    # pointer at a wrong offset would be garbage and dereferencing it could crash Blender.
+    for s in samples:
+        raw = layout.socket.from_address(s.as_pointer())
+        if raw.identifier.decode("utf-8", "replace") != s.identifier or raw.link != s.links[0].as_pointer(): return False
+    rt = [ctypes.c_void_p.from_address(s.as_pointer() + layout.runtime_offset).value for s in samples]
+    if any(not r or r % 8 for r in rt): return False
+    locs, _ = _read(layout, [s.as_pointer() for s in samples]); pad = VALIDATE_PAD * ui
+    for s, (x, y) in zip(samples, locs.tolist()):
+        l, b, r, t = node_view_bounds(s.node, ui)
+        if not (l - pad <= x <= r + pad and b - pad <= y <= t + pad): return False
+    return True
+
+def select_layout(tree, ui):
+    """Pick and verify the struct layout for this build on the first call that has sockets to check.
+
+    Returns True only on the call that settles on the RNA fallback, so callers can say so once.
+    """
+    global _layout, _candidate
+    if _layout is not None: return False
+    if _candidate is None:
+        known = [f for v, f in LAYOUTS if v <= tuple(bpy.app.version)]
+        _candidate = known[-1]() if known else False
+    if _candidate is False: _layout = False
+    elif (ok := _check(_candidate, tree, ui)) is not None: _layout = _candidate if ok else False
+    return _layout is False
+
+def fast_path():
+    return bool(_layout)
+
+def _estimate(sock, ui, rows):
+    nd = sock.node; l, b, r, t = node_view_bounds(nd, ui)
+    if nd.bl_idname == 'NodeReroute': return l, t
+    if nd.hide: return (r if sock.is_output else l), (b + t) * 0.5
+    key = (nd.as_pointer(), sock.is_output)
+    if (row := rows.get(key)) is None:
+        socks = [s.as_pointer() for s in (nd.outputs if sock.is_output else reversed(nd.inputs)) if s.enabled and not s.hide]
+        row = rows[key] = {p: i for i, p in enumerate(socks)}
+    i = row.get(sock.as_pointer(), 0)
+    if sock.is_output: return r, t - (NODE_HEADER + (i + 0.5) * SOCKET_ROW) * ui
+    return l, b + (i + 0.5) * SOCKET_ROW * ui
+
+def estimate_socket_locations(ptrs, tree, sockets=None):
+    """RNA-only approximation of ``read_socket_locations``: slower and less exact, but safe on any build.
+
+    Pointers are resolved through the tree's current graph unless ``sockets`` are given;
+    the graph is never built here, so without one every row stays invalid.
+    """
+    locs = np.zeros((len(ptrs), 2), dtype=np.float32); valid = np.zeros(len(ptrs), dtype=bool)
+    if sockets is None:
+        if (g := peek_tree_graph(tree)) is None: return locs, valid
+        sockets = [None if (s := g.sid.get(p)) is None else g.sockets[s] for p in np.asarray(ptrs, dtype=np.uint64).tolist()]
+    ui = bpy.context.preferences.system.ui_scale; rows = {}
+    for i, sock in enumerate(sockets):
+        if sock is None: continue
+        try: locs[i] = _estimate(sock, ui, rows); valid[i] = True
+        except ReferenceError: pass
+    return locs, valid
+
+def read_socket_locations(ptrs, tree, sockets=None):
+    """View-space runtime locations of many sockets of ``tree`` in one contiguous float32 buffer.
+
+    Rows follow ``ptrs``. With a verified layout, raw memmoves replace per-socket
+    ``from_address`` views; otherwise the RNA estimate is used, from ``sockets`` when
+    the caller already holds them. ``valid`` is False where the socket has no location.
+    """
+    return _read(_layout, ptrs) if _layout else estimate_socket_locations(ptrs, tree, sockets)
+
+def reset():
+    global _layout, _candidate
+    _layout = _candidate = None
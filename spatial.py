@@ -0,0 +1,90 @@
+from math import floor
+
+GRID_MIN_CELL = 64.0
+GRID_MOVE_SAMPLE = 8
+GRID_CHUNK = 128
+
+def node_view_bounds(node, ui):
+    ax, ay = node.location.x, node.location.y; p = node.parent
+    while p: ax += p.location.x; ay += p.location.y; p = p.parent
+    min_x = ax * ui; max_y = ay * ui
+    return min_x, max_y - node.dimensions.y, min_x + node.dimensions.x, max_y
+
+class NodeGrid:
+    """Uniform grid over node bounds in view space.
+
+    View space does not change with pan or zoom, so the grid only has to be
+    rebuilt when the tree itself changes (see ``key``). Dragging nodes sends no
+    tree update; ``follow`` re-bins the moved nodes instead.
+    """
+    __slots__ = ("key", "cell", "nodes", "bounds", "cells", "index", "frames")
+
+    def __init__(self, tree, ui, key=None):
+        self.key = key
+        for _ in self._build(tree, ui): pass
+
+    def _build(self, tree, ui):
+        """Fill the grid from ``tree``, yielding every GRID_CHUNK nodes so the work can be spread out."""
+        self.nodes = []; self.bounds = []; self.cells = {}; self.index = {}; self.frames = {}
+        total_w = 0.0
+        for k, node in enumerate(tree.nodes, 1):
+            if not k % GRID_CHUNK: yield
+            if node.bl_idname == 'NodeFrame': self.frames[node.as_pointer()] = tuple(node.location); continue
+            bb = node_view_bounds(node, ui); self.index[node.as_pointer()] = len(self.nodes)
+            self.nodes.append(node); self.bounds.append(bb); total_w += bb[2] - bb[0]
+        self.cell = max(GRID_MIN_CELL * ui, total_w / len(self.nodes)) if self.nodes else GRID_MIN_CELL * ui
+        inv, cells = 1.0 / self.cell, self.cells
+        for i, (l, b, r, t) in enumerate(self.bounds):
+            for ix in range(floor(l * inv), floor(r * inv) + 1):
+                for iy in range(floor(b * inv), floor(t * inv) + 1):
+                    cells.setdefault((ix, iy), []).append(i)
+            if not (i + 1) % GRID_CHUNK: yield
+
+    def _cells(self, bb):
+        inv = 1.0 / self.cell; l, b, r, t = bb
+        return [(ix, iy) for ix in range(floor(l * inv), floor(r * inv) + 1) for iy in range(floor(b * inv), floor(t * inv) + 1)]
+
+    def follow(self, selected, ui):
+        """Re-bin the ``selected`` nodes that moved since the grid was built.
+
+        A drag moves the whole selection, so a few selected nodes are sampled first.
+        Returns True when nodes moved, False when none did, and None when a frame
+        moved: that drags nodes outside the selection and the grid must be rebuilt.
+        """
+        index, bounds, frames, cells = self.index, self.bounds, self.frames, self.cells
+        def moved(nd):
+            p = nd.as_pointer()
+            if (i := index.get(p)) is not None: return node_view_bounds(nd, ui) != bounds[i]
+            return p in frames and tuple(nd.location) != frames[p]
+        if not any(moved(nd) for nd in selected[:GRID_MOVE_SAMPLE]): return False
+        for nd in selected:
+            p = nd.as_pointer()
+            if p in frames:
+                if tuple(nd.location) != frames[p]: return None
+                continue
+            if (i := index.get(p)) is None or (bb := node_view_bounds(nd, ui)) == bounds[i]: continue
+            for c in self._cells(bounds[i]): cells[c].remove(i)
+            bounds[i] = bb
+            for c in self._cells(bb): cells.setdefault(c, []).append(i)
+        return True
+
+    def query(self, x, y, pad):
+        inv, cells, bounds = 1.0 / self.cell, self.cells, self.bounds
+        seen, out = set(), []
+        for ix in range(floor((x - pad) * inv), floor((x + pad) * inv) + 1):
+            for iy in range(floor((y - pad) * inv), floor((y + pad) * inv) + 1):
+                for i in cells.get((ix, iy), ()):
+                    if i in seen: continue
+                    seen.add(i); l, b, r, t = bounds[i]
+                    if l - pad <= x <= r + pad and b - pad <= y <= t + pad: out.append(self.nodes[i])
+        return out
+
+def iter_node_grid(tree, ui, key=None):
+    """Step form of NodeGrid: yields between chunks of nodes and returns the grid."""
+    grid = NodeGrid.__new__(NodeGrid); grid.key = key
+    yield from grid._build(tree, ui)
+    return grid
+
+def view_per_px(v2d, x, y):
+    x0, _ = v2d.region_to_view(x, y); x1, _ = v2d.region_to_view(x + 100, y)
+    return abs(x1 - x0) / 100.0 or 1.0
@@ -0,0 +1,114 @@
+import bpy, time
+from .graph import GROUP_IDNAMES
+
+BUILD_BUDGET = 0.002
+BUILD_INTERVAL = 0.05
+
+# (owner kind, bpy.data collection, ID type, attribute holding the node tree or None for the ID itself)
+OWNER_SOURCES = (('NODETREE', "node_groups", bpy.types.NodeTree, None),
+                 ('MATERIAL', "materials", bpy.types.Material, "node_tree"),
+                 ('WORLD', "worlds", bpy.types.World, "node_tree"),
+                 ('LIGHT', "lights", bpy.types.Light, "node_tree"),
+                 ('SCENE', "scenes", bpy.types.Scene, "node_tree"),
+                 ('LINESTYLE', "linestyles", bpy.types.FreestyleLineStyle, "node_tree"))
+
+_users = {}   # group tree pointer -> {owner key: [group node names]}
+_owned = {}   # owner key -> group tree pointers it references
+_dirty = set()
+_build = None
+
+def owner_tree(key):
+    kind, name = key
+    for k, coll, _, attr in OWNER_SOURCES:
+        if k == kind:
+            idd = getattr(bpy.data, coll).get(name)
+            return idd if idd is None or attr is None else getattr(idd, attr, None)
+    return None
+
+def tree_owner(tree):
+    """Owner key of ``tree`` as understood by ``owner_tree``: the node group itself, or the ID embedding it."""
+    if not tree.is_embedded_data: return ('NODETREE', tree.name)
+    for kind, coll, _, attr in OWNER_SOURCES:
+        if attr is not None and (idd := next((i for i in getattr(bpy.data, coll) if getattr(i, attr, None) == tree), None)):
+            return (kind, idd.name)
+    return None
+
+def _owner_key(idd):
+    for kind, _, typ, attr in OWNER_SOURCES:
+        if isinstance(idd, typ):
+            if attr is None: return None if idd.is_embedded_data else (kind, idd.name)
+            return (kind, idd.name) if getattr(idd, attr, None) is not None else None
+    return None
+
+def _index(key):
+    for p in _owned.pop(key, ()):
+        if (users := _users.get(p)) is not None:
+            users.pop(key, None)
+            if not users: del _users[p]
+    if (tree := owner_tree(key)) is None: return
+    owned = _owned[key] = set()
+    for nd in tree.nodes:
+        if nd.bl_idname in GROUP_IDNAMES and (inner := nd.node_tree) is not None:
+            p = inner.as_pointer(); owned.add(p)
+            _users.setdefault(p, {}).setdefault(key, []).append(nd.name)
+
+def _build_steps():
+    _users.clear(); _owned.clear()
+    keys = [(kind, idd.name) for kind, coll, _, attr in OWNER_SOURCES for idd in getattr(bpy.data, coll)
+            if attr is None and not idd.is_embedded_data or attr is not None and getattr(idd, attr, None) is not None]
+    for key in keys:
+        _index(key); yield True
+
+def _flush(deadline=None):
+    """Index pending owners; with ``deadline`` stop early and return False when work remains."""
+    global _build
+    while _build is not None:
+        if next(_build, None) is None: _build = None
+        if deadline is not None and time.perf_counter() > deadline: return _build is None and not _dirty
+    while _dirty:
+        _index(_dirty.pop())
+        if deadline is not None and time.perf_counter() > deadline: return not _dirty
+    return True
+
+def _tick():
+    return None if _flush(time.perf_counter() + BUILD_BUDGET) else BUILD_INTERVAL
+
+def _schedule():
+    if not bpy.app.timers.is_registered(_tick): bpy.app.timers.register(_tick, first_interval=BUILD_INTERVAL)
+
+def group_users(group_tree, budget=None):
+    """{owner key: [group node names]} of every tree that uses ``group_tree``.
+
+    Owner keys are (kind, ID name) as understood by ``owner_tree``. Pending
+    indexing is finished first, so the lookup itself is a single dict access.
+    With ``budget`` (seconds) indexing gets at most that long here and the rest
+    continues in the background; None is returned until it is done.
+    """
+    if not _flush(None if budget is None else time.perf_counter() + budget): _schedule(); return None
+    return _users.get(group_tree.as_pointer(), {})
+
+@bpy.app.handlers.persistent
+def _on_depsgraph_update(scene, depsgraph):
+    for upd in depsgraph.updates:
+        try: key = _owner_key(upd.id.original)
+        except ReferenceError: continue
+        if key is not None: _dirty.add(key)
+    if _dirty: _schedule()
+
+@bpy.app.handlers.persistent
+def _on_reset(*args):
+    global _build
+    _dirty.clear(); _build = _build_steps(); _schedule()
+
+def register():
+    bpy.app.handlers.depsgraph_update_post.append(_on_depsgraph_update)
+    for h in (bpy.app.handlers.undo_post, bpy.app.handlers.redo_post, bpy.app.handlers.load_post): h.append(_on_reset)
+    _on_reset()
+
+def unregister():
+    global _build
+    if bpy.app.timers.is_registered(_tick): bpy.app.timers.unregister(_tick)
+    for h, f in ((bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update), (bpy.app.handlers.undo_post, _on_reset),
+                 (bpy.app.handlers.redo_post, _on_reset), (bpy.app.handlers.load_post, _on_reset)):
+        if f in h: h.remove(f)
+    _users.clear(); _owned.clear(); _dirty.clear(); _build = None